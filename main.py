@@ -10,9 +10,8 @@ Date: September 17, 2025
 Assignment: Data Curation for FinTech
 """
 
-from src.data_collector import FinancialDataCollector
-from src.config import Config
 import argparse
+import logging
 import sys
 import os
 
@@ -65,9 +64,20 @@ Examples:
     
     args = parser.parse_args()
     
+    # Progress is reported through the logging handlers set up by setup_logging
+    logger = logging.getLogger(__name__)
+    
     try:
+        # Heavy imports (pandas, yfinance, news stack) are deferred until after
+        # argument parsing so `--help` and usage errors return immediately
+        from src.data_collector import FinancialDataCollector
+        from src.config import get_default_config
+        from src.utils import setup_logging
+        
+        setup_logging()
+        
         # Initialize configuration
-        config = Config()
+        config = get_default_config()
         
         # Create output directory if it doesn't exist
         os.makedirs(args.output_dir, exist_ok=True)
@@ -75,10 +85,10 @@ Examples:
         # Initialize data collector
         collector = FinancialDataCollector(config)
         
-        print(f"🚀 Starting data collection for {args.symbol} on {args.exchange}")
-        print(f"📅 Collecting {args.days} days of historical data")
-        print(f"💾 Output format: {args.output_format}")
-        print("-" * 50)
+        logger.info(f"🚀 Starting data collection for {args.symbol} on {args.exchange}")
+        logger.info(f"📅 Collecting {args.days} days of historical data")
+        logger.info(f"💾 Output format: {args.output_format}")
+        logger.info("-" * 50)
         
         # Collect the data
         dataset = collector.collect_data(
@@ -95,11 +105,11 @@ Examples:
             format_type=args.output_format
         )
         
-        print("✅ Data collection completed successfully!")
-        print(f"📁 Output saved to: {args.output_dir}")
+        logger.info("✅ Data collection completed successfully!")
+        logger.info(f"📁 Output saved to: {args.output_dir}")
         
     except Exception as e:
-        print(f"❌ Error: {e}")
+        logger.error(f"❌ Error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
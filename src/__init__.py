@@ -2,11 +2,7 @@
 FinTech Data Curator - Source Package
 """
 
-from .config import Config
-from .data_collector import FinancialDataCollector
-from .structured_data import StructuredDataCollector
-from .unstructured_data import UnstructuredDataCollector
-from .utils import setup_logging
+from importlib import import_module
 
 __version__ = "1.0.0"
 __author__ = "CS4063 Student"
@@ -17,4 +13,24 @@ __all__ = [
     'StructuredDataCollector', 
     'UnstructuredDataCollector',
     'setup_logging'
-]
\ No newline at end of file
+]
+
+# Exports are loaded lazily (PEP 562) so importing the package, or running
+# `main.py --help`, does not pull in pandas, yfinance or the news stack.
+_LAZY_EXPORTS = {
+    'Config': '.config',
+    'FinancialDataCollector': '.data_collector',
+    'StructuredDataCollector': '.structured_data',
+    'UnstructuredDataCollector': '.unstructured_data',
+    'setup_logging': '.utils'
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
@@ -4,8 +4,16 @@ Configuration management for FinTech Data Curator
 
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List
 
+# Optional: Aho-Corasick automaton for single-pass keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 class Config:
     """Configuration class for managing application settings."""
     
@@ -66,7 +74,8 @@ class Config:
             'macd_signal': 9,  # MACD signal period
             'stoch_k_period': 14,  # Stochastic %K period
             'stoch_d_period': 3,  # Stochastic %D period
-            'williams_r_period': 14  # Williams %R period
+            'williams_r_period': 14,  # Williams %R period
+            'correlation_window': 20  # S&P 500 return correlation window
         }
         
         # Feature selection settings
@@ -101,13 +110,45 @@ class Config:
             'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'delay_between_requests': 1,  # seconds
             'max_retries': 3,
-            'timeout': 30
+            'timeout': 30,
+            'rss_max_workers': 10,  # parallel RSS feed fetches
+            'per_feed_timeout': 10,  # seconds
+            'pool_maxsize': 32  # pooled keep-alive connections per host
+        }
+        
+        # Persistent HTTP cache for news requests (requires requests-cache)
+        self.http_cache = {
+            'enabled': True,
+            'cache_name': '.cache/http',  # SQLite file path (without extension)
+            'expire_after': 900,  # seconds
+            'rss_cache_dir': '.cache/rss',  # ETag/Last-Modified validators + last feed bodies
+            'coindesk_max_age': 300  # seconds a parsed CoinDesk feed is reused across symbols
+        }
+        
+        # Headline sentiment scoring. FinBERT (requires transformers + torch) is a
+        # finance-tuned model scored in batches; otherwise TextBlob's lexicon is used
+        self.sentiment = {
+            'use_finbert': False,
+            'finbert_model': 'ProsusAI/finbert',
+            'batch_size': 32
+        }
+        
+        # Cache for raw yfinance history and enhanced indicator frames
+        # (parquet on disk when pyarrow is installed)
+        self.price_cache = {
+            'enabled': True,
+            'cache_dir': '.cache/prices',
+            'memory_entries': 256,  # in-process LRU size
+            'max_age': 86400,  # seconds; daily bars up to yesterday do not change
+            'market_max_age': 900  # seconds; market indicators include live values
         }
         
         # News filtering settings
         self.news_filters = {
             'max_articles_per_day': 15,
             'min_headline_length': 10,
+            # Headlines with fewer words are scored neutral without running the lexicon
+            'min_sentiment_words': 4,
             'relevant_keywords': [
                 'stock', 'market', 'trading', 'price', 'earnings',
                 'revenue', 'profit', 'loss', 'shares', 'investment',
@@ -151,6 +192,49 @@ class Config:
             'min_data_points': 5,  # Minimum data points required
             'max_missing_percentage': 20  # Maximum percentage of missing data allowed
         }
+        
+        # Precomputed keyword lookups for news filtering
+        self._keywords = tuple(k.lower() for k in self.news_filters['relevant_keywords'])
+        self._keyword_set = frozenset(self._keywords)
+        self._kw_automaton = self._build_keyword_automaton(self._keywords)
+    
+    @staticmethod
+    def _build_keyword_automaton(keywords):
+        """Compile keywords into an Aho-Corasick automaton if the library is available."""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def find_keywords(self, text: str) -> List[str]:
+        """Find all relevant news keywords mentioned in text."""
+        if not text:
+            return []
+        text_lower = text.lower()
+        
+        if self._kw_automaton is not None:
+            return [keyword for _, keyword in self._kw_automaton.iter(text_lower)]
+        return [keyword for keyword in self._keywords if keyword in text_lower]
+    
+    def match_keywords(self, text: str) -> bool:
+        """Check whether text mentions any relevant news keyword."""
+        if not text:
+            return False
+        text_lower = text.lower()
+        
+        # Single linear scan over the text for all keywords at once
+        if self._kw_automaton is not None:
+            return next(self._kw_automaton.iter(text_lower), None) is not None
+        
+        # Fast path: whole-word hit via C-level set intersection
+        if not self._keyword_set.isdisjoint(text_lower.split()):
+            return True
+        
+        # Substring scan still catches multi-word keywords and inflections
+        return any(keyword in text_lower for keyword in self._keywords)
     
     def get_symbol_with_suffix(self, symbol: str, exchange: str) -> str:
         """Get symbol with appropriate suffix for the exchange."""
@@ -159,6 +243,10 @@ class Config:
             return f"{symbol}{suffix}" if suffix else symbol
         return symbol
     
+    def get_all_indicator_symbols(self) -> List[str]:
+        """Get all market indicator ticker symbols for batched fetching."""
+        return list(self.market_indicators.values())
+    
     def get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for web scraping."""
         return {
@@ -169,8 +257,14 @@ class Config:
             'Connection': 'keep-alive',
         }
     
-    def get_date_range(self, days: int) -> tuple:
+    def get_date_range(self, days: int, now: datetime = None) -> tuple:
         """Get start and end dates for data collection."""
-        end_date = datetime.now().date()
+        end_date = (now or datetime.now()).date()
         start_date = end_date - timedelta(days=days)
-        return start_date, end_date
\ No newline at end of file
+        return start_date, end_date
+
+
+@lru_cache(maxsize=None)
+def get_default_config() -> Config:
+    """Get a shared default Config instance, built once per process."""
+    return Config()
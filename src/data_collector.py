@@ -4,29 +4,66 @@ Coordinates structured and unstructured data collection
 """
 
 import json
-import csv
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 import logging
 import pandas as pd
 
-from .config import Config
+from .config import Config, get_default_config
 from .structured_data import StructuredDataCollector
 from .unstructured_data import UnstructuredDataCollector
 from .utils import setup_logging, clean_financial_data, validate_data_completeness
-from .utils import setup_logging, validate_symbol, validate_exchange
+from .utils import validate_symbol, validate_exchange
+from .utils import create_cached_session, create_robust_session
+
+# Optional: orjson for faster JSON export (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class FinancialDataCollector:
     """Main coordinator for financial data collection."""
     
     def __init__(self, config: Config = None):
-        self.config = config or Config()
+        self.config = config or get_default_config()
         self.logger = setup_logging()
         
+        # One pooled HTTP session shared by all news requests. It is backed by the
+        # persistent cache when enabled and available; yfinance rejects caching
+        # sessions, so price data is not routed through it.
+        self.session = self._create_session()
+        
         # Initialize sub-collectors
         self.structured_collector = StructuredDataCollector(self.config)
-        self.unstructured_collector = UnstructuredDataCollector(self.config)
+        self.unstructured_collector = UnstructuredDataCollector(self.config, session=self.session)
+    
+    def _create_session(self):
+        """Create the shared HTTP session used by the sub-collectors."""
+        retries = self.config.scraping['max_retries']
+        pool_maxsize = self.config.scraping['pool_maxsize']
+        
+        session = None
+        if self.config.http_cache['enabled']:
+            session = create_cached_session(
+                self.config.http_cache['cache_name'],
+                self.config.http_cache['expire_after'],
+                retries=retries,
+                pool_maxsize=pool_maxsize
+            )
+        if session is None:
+            session = create_robust_session(retries=retries, pool_maxsize=pool_maxsize)
+        
+        session.headers.update(self.config.get_headers())
+        return session
+    
+    def close(self):
+        """Release pooled HTTP connections."""
+        self.session.close()
     
     def collect_data(self, exchange: str, symbol: str, days: int) -> Dict[str, Any]:
         """Main method to collect all data for a given symbol."""
@@ -41,11 +78,22 @@ class FinancialDataCollector:
             if days <= 0:
                 raise ValueError(f"Days must be positive: {days}")
             
+            # Single run timestamp shared by the metadata and the export filenames
+            run_ts = datetime.now()
+            
             self.logger.info(f"Starting data collection for {symbol} on {exchange}")
             
-            # Collect structured data
-            self.logger.info("Collecting structured data...")
-            raw_structured_data = self.structured_collector.get_latest_data(symbol, exchange, days)
+            # Collect structured and unstructured data concurrently (both are network-bound)
+            self.logger.info("Collecting structured and unstructured data...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                structured_future = executor.submit(
+                    self.structured_collector.get_latest_data, symbol, exchange, days
+                )
+                news_future = executor.submit(
+                    self.unstructured_collector.collect_news_data, symbol, exchange, days
+                )
+                raw_structured_data = structured_future.result()
+                news_data = news_future.result()
             
             # Phase 1 Enhancement: Clean and validate structured data
             self.logger.info("Cleaning and validating structured data...")
@@ -56,27 +104,28 @@ class FinancialDataCollector:
             if not validation_result['is_valid']:
                 self.logger.warning(f"Data quality warning: {validation_result['completeness_ratio']:.2%} completeness")
             
-            # Collect unstructured data
-            self.logger.info("Collecting unstructured data...")
-            news_data = self.unstructured_collector.collect_news_data(symbol, exchange, days)
-            
             # Merge data
             self.logger.info("Merging structured and unstructured data...")
-            merged_data = self._merge_data(structured_data, news_data, days)
+            merged_data, news_by_date = self._merge_data(structured_data, news_data, days)
+            
+            # The merged records hold their own copies; release the frames now
+            del raw_structured_data, structured_data
             
             # Create dataset
             dataset = {
                 'metadata': {
                     'symbol': symbol,
                     'exchange': exchange,
-                    'collection_date': datetime.now().isoformat(),
+                    'collection_date': run_ts.isoformat(),
                     'days_requested': days,
                     'days_collected': len(merged_data),
                     'data_quality': self._assess_data_quality(merged_data),
                     # Phase 1 Enhancement: Add data validation metrics
                     'data_validation': validation_result
                 },
-                'data': merged_data
+                'data': merged_data,
+                # All aligned news, stored once and keyed by each record's date
+                'news_by_date': news_by_date
             }
             
             self.logger.info(f"Data collection completed. Collected {len(merged_data)} days of data")
@@ -87,43 +136,43 @@ class FinancialDataCollector:
             raise
     
     def _merge_data(self, structured_data: pd.DataFrame, 
-                   news_data: List[Dict], days: int) -> List[Dict]:
-        """Merge structured and unstructured data by date."""
+                   news_data: List[Dict], days: int) -> Tuple[List[Dict], Dict[str, List[Dict]]]:
+        """Merge structured and unstructured data by date.
+        
+        Returns the merged per-day records and the full news list per date.
+        """
         try:
             merged_records = []
             
-            # Create date range from structured data
-            date_range = [datetime.strptime(str(date), '%Y-%m-%d') 
-                         for date in structured_data['date'].values]
+            # Parse dates once; reuse for the alignment range and the string keys
+            dates = pd.to_datetime(structured_data['date'])
+            date_range = dates.tolist()
+            date_strs = dates.dt.strftime(self.config.output['date_format'])
             
             # Align news with dates
             aligned_news = self.unstructured_collector.align_news_with_dates(news_data, date_range)
             
+            # Convert the frame to records once instead of walking it row by row
+            records = structured_data.assign(date=date_strs).to_dict(orient='records')
+            
             # Merge each day's data
-            for _, row in structured_data.iterrows():
-                date_str = str(row['date'])
-                
-                # Get structured data for this date
-                structured_record = row.to_dict()
-                
-                # Convert date to string for consistency
-                structured_record['date'] = date_str
+            for structured_record in records:
+                date_str = structured_record.pop('date')
                 
                 # Get news for this date
                 date_news = aligned_news.get(date_str, [])
                 representative_news = self.unstructured_collector.get_representative_news(date_news)
                 
-                # Create merged record
+                # Create merged record (full news list lives in news_by_date[date])
                 merged_record = {
                     'date': date_str,
-                    'structured': {k: v for k, v in structured_record.items() if k != 'date'},
-                    'unstructured': representative_news,
-                    'all_news': date_news  # Keep all news for reference
+                    'structured': structured_record,
+                    'unstructured': representative_news
                 }
                 
                 merged_records.append(merged_record)
             
-            return merged_records
+            return merged_records, aligned_news
             
         except Exception as e:
             self.logger.error(f"Error merging data: {e}")
@@ -135,23 +184,22 @@ class FinancialDataCollector:
             if not data:
                 return {'quality_score': 0, 'issues': ['No data collected']}
             
-            issues = []
             total_records = len(data)
-            complete_records = 0
             
-            for record in data:
-                structured = record.get('structured', {})
-                unstructured = record.get('unstructured', {})
-                
-                # Check structured data completeness
-                required_fields = ['open', 'high', 'low', 'close', 'volume']
-                if all(field in structured and structured[field] not in [None, 0] 
-                       for field in required_fields):
-                    complete_records += 1
-                
-                # Check for news availability
-                if not unstructured.get('headline') or unstructured.get('headline') == 'No relevant news found':
-                    issues.append(f"No news found for {record['date']}")
+            # Check structured data completeness in one vectorized pass
+            required_fields = ['open', 'high', 'low', 'close', 'volume']
+            structured = pd.DataFrame.from_records(
+                [record.get('structured', {}) for record in data]
+            ).reindex(columns=required_fields)
+            complete_mask = (structured.notna() & (structured != 0)).all(axis=1)
+            complete_records = int(complete_mask.sum())
+            
+            # Check for news availability
+            issues = [
+                f"No news found for {record['date']}"
+                for record in data
+                if record.get('unstructured', {}).get('headline') in (None, '', 'No relevant news found')
+            ]
             
             quality_score = (complete_records / total_records) * 100 if total_records > 0 else 0
             
@@ -170,18 +218,31 @@ class FinancialDataCollector:
                    output_dir: str, format_type: str = 'both'):
         """Export dataset to specified format(s)."""
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # Reuse the collection timestamp so filenames match the metadata
+            collection_date = dataset.get('metadata', {}).get('collection_date')
+            run_ts = datetime.fromisoformat(collection_date) if collection_date else datetime.now()
+            timestamp = run_ts.strftime('%Y%m%d_%H%M%S')
             base_filename = f"{symbol}_{timestamp}"
             
+            exports = []
+            
             if format_type in ['csv', 'both']:
                 csv_path = os.path.join(output_dir, f"{base_filename}.csv")
-                self._export_to_csv(dataset, csv_path)
-                self.logger.info(f"CSV exported to: {csv_path}")
+                exports.append(('CSV', self._export_to_csv, csv_path))
             
             if format_type in ['json', 'both']:
                 json_path = os.path.join(output_dir, f"{base_filename}.json")
-                self._export_to_json(dataset, json_path)
-                self.logger.info(f"JSON exported to: {json_path}")
+                exports.append(('JSON', self._export_to_json, json_path))
+            
+            # Independent writers: run them side by side when exporting both formats
+            with ThreadPoolExecutor(max_workers=max(len(exports), 1)) as executor:
+                futures = [
+                    (label, path, executor.submit(export_func, dataset, path))
+                    for label, export_func, path in exports
+                ]
+                for label, path, future in futures:
+                    future.result()
+                    self.logger.info(f"{label} exported to: {path}")
             
         except Exception as e:
             self.logger.error(f"Error exporting data: {e}")
@@ -190,40 +251,38 @@ class FinancialDataCollector:
     def _export_to_csv(self, dataset: Dict[str, Any], filepath: str):
         """Export dataset to CSV format."""
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                # Define CSV headers
-                headers = ['date']
-                
-                # Add structured data headers
-                if dataset['data']:
-                    structured_sample = dataset['data'][0]['structured']
-                    headers.extend(structured_sample.keys())
-                
-                # Add unstructured data headers
-                headers.extend(['news_headline', 'news_summary', 'news_sentiment', 
-                               'news_source', 'news_relevance'])
-                
-                writer = csv.DictWriter(csvfile, fieldnames=headers)
-                writer.writeheader()
-                
-                # Write data rows
-                for record in dataset['data']:
-                    row = {'date': record['date']}
-                    
-                    # Add structured data
-                    row.update(record['structured'])
-                    
-                    # Add unstructured data
-                    unstructured = record['unstructured']
-                    row.update({
-                        'news_headline': unstructured.get('headline', ''),
-                        'news_summary': unstructured.get('summary', ''),
-                        'news_sentiment': unstructured.get('sentiment', 0.5),
-                        'news_source': unstructured.get('source', ''),
-                        'news_relevance': unstructured.get('relevance', 0.0)
-                    })
-                    
-                    writer.writerow(row)
+            records = dataset['data']
+            
+            # Define CSV headers
+            headers = ['date']
+            
+            # Add structured data headers
+            if records:
+                structured_sample = records[0]['structured']
+                headers.extend(structured_sample.keys())
+            
+            # Add unstructured data headers (output column -> source key, default)
+            news_columns = {
+                'news_headline': ('headline', ''),
+                'news_summary': ('summary', ''),
+                'news_sentiment': ('sentiment', 0.5),
+                'news_source': ('source', ''),
+                'news_relevance': ('relevance', 0.0)
+            }
+            headers.extend(news_columns.keys())
+            
+            # Build one flat frame and let pandas' C writer emit it
+            flat = pd.DataFrame.from_records(
+                [record['structured'] for record in records],
+                columns=headers[1:len(headers) - len(news_columns)]
+            )
+            flat.insert(0, 'date', [record['date'] for record in records])
+            
+            for column, (key, default) in news_columns.items():
+                flat[column] = [record['unstructured'].get(key, default) for record in records]
+            
+            flat.to_csv(filepath, columns=headers, index=False, encoding='utf-8',
+                        sep=self.config.output['csv_separator'], lineterminator='\r\n')
                     
         except Exception as e:
             self.logger.error(f"Error exporting to CSV: {e}")
@@ -232,6 +291,16 @@ class FinancialDataCollector:
     def _export_to_json(self, dataset: Dict[str, Any], filepath: str):
         """Export dataset to JSON format."""
         try:
+            if ORJSON_AVAILABLE:
+                # orjson handles numpy scalars, dates and NaN/inf (as null) natively
+                options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                if self.config.output['json_indent']:
+                    options |= orjson.OPT_INDENT_2
+                
+                with open(filepath, 'wb') as jsonfile:
+                    jsonfile.write(orjson.dumps(dataset, default=self._json_default, option=options))
+                return
+            
             # Clean dataset for JSON serialization
             clean_dataset = self._clean_for_json(dataset)
             
@@ -243,6 +312,13 @@ class FinancialDataCollector:
             self.logger.error(f"Error exporting to JSON: {e}")
             raise
     
+    @staticmethod
+    def _json_default(obj):
+        """Fallback serializer for objects orjson does not handle natively."""
+        if hasattr(obj, 'isoformat'):  # datetime objects
+            return obj.isoformat()
+        return str(obj)
+    
     def _clean_for_json(self, obj):
         """Clean data structure for JSON serialization."""
         if isinstance(obj, dict):
@@ -251,7 +327,7 @@ class FinancialDataCollector:
             return [self._clean_for_json(item) for item in obj]
         elif hasattr(obj, 'isoformat'):  # datetime objects
             return obj.isoformat()
-        elif isinstance(obj, (float, int)) and str(obj) in ['nan', 'inf', '-inf']:
-            return None
+        elif isinstance(obj, float):  # ints can never be nan/inf
+            return obj if math.isfinite(obj) else None
         else:
             return obj
\ No newline at end of file
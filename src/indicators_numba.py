@@ -0,0 +1,409 @@
+"""
+Numba-compiled technical indicator kernels for FinTech Data Curator
+Single-pass loops over float64 arrays that mirror the pandas implementations
+"""
+
+from functools import lru_cache
+from typing import Callable, Tuple
+
+import numpy as np
+
+# Numba is optional; without it the collector keeps using the pandas path
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels below still import without numba."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# error_model='numpy' keeps pandas' inf/NaN results on division by zero
+# instead of raising ZeroDivisionError inside the kernels.
+@njit(cache=True, error_model='numpy')
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean with pandas semantics (NaN until `window` valid values)."""
+    n = len(values)
+    out = np.full(n, np.nan)
+    total = 0.0
+    count = 0
+    for i in range(n):
+        value = values[i]
+        if value == value:
+            total += value
+            count += 1
+        if i >= window:
+            old = values[i - window]
+            if old == old:
+                total -= old
+                count -= 1
+        if count >= window:
+            out[i] = total / count
+    return out
+
+
+@njit(cache=True, error_model='numpy')
+def rolling_mean_std(values: np.ndarray, window: int):
+    """Rolling mean and sample standard deviation (ddof=1) in a single pass.
+    
+    Welford updates add the incoming value and remove the outgoing one; like
+    pandas, a window whose values are all equal reports a std of exactly zero.
+    """
+    n = len(values)
+    mean_out = np.full(n, np.nan)
+    std_out = np.full(n, np.nan)
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    previous = np.nan
+    same_count = 0
+    for i in range(n):
+        value = values[i]
+        if value == value:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+            if value == previous:
+                same_count += 1
+            else:
+                same_count = 1
+            previous = value
+        if i >= window:
+            old = values[i - window]
+            if old == old:
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / count
+                    m2 -= delta * (old - mean)
+        if count >= window:
+            mean_out[i] = mean
+            if count >= 2:
+                if same_count >= count:
+                    std_out[i] = 0.0
+                else:
+                    std_out[i] = np.sqrt(max(m2, 0.0) / (count - 1))
+    return mean_out, std_out
+
+
+@njit(cache=True, error_model='numpy')
+def rolling_corr(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """Rolling Pearson correlation in a single pass (pandas `rolling(window).corr()`).
+    
+    Only positions where both series are valid enter the window; NaN until
+    `window` such pairs are present or when either side has zero variance.
+    """
+    n = len(x)
+    out = np.full(n, np.nan)
+    count = 0
+    mean_x = 0.0
+    mean_y = 0.0
+    m2_x = 0.0
+    m2_y = 0.0
+    co_moment = 0.0
+    for i in range(n):
+        xi = x[i]
+        yi = y[i]
+        if xi == xi and yi == yi:
+            count += 1
+            dx = xi - mean_x
+            dy = yi - mean_y
+            mean_x += dx / count
+            mean_y += dy / count
+            m2_x += dx * (xi - mean_x)
+            m2_y += dy * (yi - mean_y)
+            co_moment += dx * (yi - mean_y)
+        if i >= window:
+            xo = x[i - window]
+            yo = y[i - window]
+            if xo == xo and yo == yo:
+                count -= 1
+                if count == 0:
+                    mean_x = 0.0
+                    mean_y = 0.0
+                    m2_x = 0.0
+                    m2_y = 0.0
+                    co_moment = 0.0
+                else:
+                    previous_mean_y = mean_y
+                    dx = xo - mean_x
+                    dy = yo - mean_y
+                    mean_x -= dx / count
+                    mean_y -= dy / count
+                    m2_x -= dx * (xo - mean_x)
+                    m2_y -= dy * (yo - mean_y)
+                    co_moment -= (xo - mean_x) * (yo - previous_mean_y)
+        if count >= window and count >= 2 and m2_x > 0 and m2_y > 0:
+            out[i] = co_moment / np.sqrt(m2_x * m2_y)
+    return out
+
+
+@njit(cache=True, error_model='numpy')
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample standard deviation (ddof=1) with pandas semantics."""
+    return rolling_mean_std(values, window)[1]
+
+
+@njit(cache=True, error_model='numpy')
+def _rolling_extreme(values: np.ndarray, window: int, take_max: bool) -> np.ndarray:
+    """Rolling min/max in O(n) using a monotonic deque of window indices."""
+    n = len(values)
+    out = np.full(n, np.nan)
+    # Ring buffer of candidate indices; values along it are monotonic
+    candidates = np.empty(window, np.int64)
+    head = 0
+    size = 0
+    count = 0
+    for i in range(n):
+        if i >= window:
+            old = values[i - window]
+            if old == old:
+                count -= 1
+            # Drop the front candidate once it leaves the window
+            if size > 0 and candidates[head] <= i - window:
+                head = (head + 1) % window
+                size -= 1
+        
+        value = values[i]
+        if value == value:
+            count += 1
+            # Candidates dominated by the incoming value can never be the extreme again
+            while size > 0:
+                last = values[candidates[(head + size - 1) % window]]
+                if (last <= value) if take_max else (last >= value):
+                    size -= 1
+                else:
+                    break
+            candidates[(head + size) % window] = i
+            size += 1
+        
+        if count >= window:
+            out[i] = values[candidates[head]]
+    return out
+
+
+@njit(cache=True, error_model='numpy')
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling minimum with pandas semantics."""
+    return _rolling_extreme(values, window, False)
+
+
+@njit(cache=True, error_model='numpy')
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling maximum with pandas semantics."""
+    return _rolling_extreme(values, window, True)
+
+
+@njit(cache=True, error_model='numpy')
+def ewm_mean(values: np.ndarray, alpha: float, adjust: bool, min_periods: int) -> np.ndarray:
+    """Exponentially weighted mean matching pandas `ewm(alpha=..., adjust=...).mean()` (ignore_na=False)."""
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n == 0:
+        return out
+    
+    min_periods = max(min_periods, 1)
+    new_wt = 1.0 if adjust else alpha
+    old_wt_factor = 1.0 - alpha
+    # pandas re-weights NaN gaps as 1 - old_wt when adjust=False and com == 1
+    gap_reweight = not adjust and old_wt_factor / alpha == 1.0
+    weighted = values[0]
+    nobs = 1 if weighted == weighted else 0
+    old_wt = 1.0
+    if nobs >= min_periods:
+        out[0] = weighted
+    
+    for i in range(1, n):
+        value = values[i]
+        is_observation = value == value
+        if is_observation:
+            nobs += 1
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if gap_reweight:
+                new_wt = 1.0 - old_wt
+            if is_observation:
+                if weighted != value:
+                    weighted = (old_wt * weighted + new_wt * value) / (old_wt + new_wt)
+                if adjust:
+                    old_wt += new_wt
+                else:
+                    old_wt = 1.0
+        elif is_observation:
+            weighted = value
+        if nobs >= min_periods:
+            out[i] = weighted
+    return out
+
+
+@njit(cache=True, error_model='numpy')
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average matching pandas `ewm(span=span).mean()` (adjust=True)."""
+    return ewm_mean(values, 2.0 / (span + 1.0), True, 0)
+
+
+@njit(cache=True, error_model='numpy')
+def rsi(close: np.ndarray, period: int) -> np.ndarray:
+    """Relative Strength Index with Wilder smoothing of gains and losses."""
+    n = len(close)
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+    
+    # Wilder's smoothing is an EWM with alpha = 1 / period (adjust=False)
+    alpha = 1.0 / period
+    avg_gain = ewm_mean(gains, alpha, False, period)
+    avg_loss = ewm_mean(losses, alpha, False, period)
+    
+    out = np.full(n, np.nan)
+    for i in range(n):
+        rs = avg_gain[i] / avg_loss[i]
+        out[i] = 100.0 - 100.0 / (1.0 + rs)
+    return out
+
+
+@njit(cache=True, error_model='numpy')
+def bollinger(close: np.ndarray, period: int, num_std: float):
+    """Upper and lower Bollinger Bands."""
+    sma, std = rolling_mean_std(close, period)
+    return sma + std * num_std, sma - std * num_std
+
+
+@njit(cache=True, error_model='numpy')
+def macd(close: np.ndarray, fast: int, slow: int, signal: int):
+    """MACD line, signal line and histogram."""
+    macd_line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+@njit(cache=True, error_model='numpy')
+def stoch(high: np.ndarray, low: np.ndarray, close: np.ndarray, k_period: int, d_period: int):
+    """Stochastic Oscillator %K and %D."""
+    lowest_low = rolling_min(low, k_period)
+    highest_high = rolling_max(high, k_period)
+    # A flat window has no range; report NaN rather than inf
+    price_range = highest_high - lowest_low
+    price_range[price_range == 0] = np.nan
+    k_percent = 100.0 * ((close - lowest_low) / price_range)
+    d_percent = rolling_mean(k_percent, d_period)
+    return k_percent, d_percent
+
+
+@njit(cache=True, error_model='numpy')
+def williams_r(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """Williams %R indicator."""
+    highest_high = rolling_max(high, period)
+    lowest_low = rolling_min(low, period)
+    # A flat window has no range; report NaN rather than inf
+    price_range = highest_high - lowest_low
+    price_range[price_range == 0] = np.nan
+    return -100.0 * ((highest_high - close) / price_range)
+
+
+@njit(cache=True, error_model='numpy')
+def pct_change(values: np.ndarray) -> np.ndarray:
+    """Percentage change from the previous element (pandas `pct_change()`)."""
+    n = len(values)
+    out = np.full(n, np.nan)
+    for i in range(1, n):
+        out[i] = values[i] / values[i - 1] - 1.0
+    return out
+
+
+@njit(cache=True, error_model='numpy')
+def zscore_outlier_mask(values: np.ndarray, threshold: float) -> np.ndarray:
+    """Column-wise |z| > threshold on a 2-D array (NaN-skipping mean, ddof=1 std)."""
+    n_rows, n_cols = values.shape
+    out = np.zeros((n_rows, n_cols), dtype=np.bool_)
+    for j in range(n_cols):
+        total = 0.0
+        count = 0
+        for i in range(n_rows):
+            value = values[i, j]
+            if value == value:
+                total += value
+                count += 1
+        if count < 2:
+            continue  # std undefined: nothing is flagged
+        mean = total / count
+        
+        sq_dev = 0.0
+        for i in range(n_rows):
+            value = values[i, j]
+            if value == value:
+                sq_dev += (value - mean) * (value - mean)
+        std = np.sqrt(sq_dev / (count - 1))
+        
+        # Fused subtract/divide/abs/compare; NaN values and zero spread compare False
+        for i in range(n_rows):
+            out[i, j] = abs(values[i, j] - mean) / std > threshold
+    return out
+
+
+@njit(cache=True, error_model='numpy')
+def compute_all(close: np.ndarray, high: np.ndarray, low: np.ndarray, ma_periods: np.ndarray,
+                volatility_window: int, rsi_period: int, bb_period: int, bb_std: float,
+                macd_fast: int, macd_slow: int, macd_signal: int,
+                stoch_k_period: int, stoch_d_period: int, williams_r_period: int):
+    """Compute every technical indicator in a single compiled call.
+    
+    Returns (daily_return, volatility, moving_averages, rsi, bollinger_upper,
+    bollinger_lower, macd, macd_signal, macd_histogram, stoch_k, stoch_d,
+    williams_r); moving_averages has one row per entry of `ma_periods`.
+    """
+    n = len(close)
+    daily_return = pct_change(close)
+    volatility = rolling_std(daily_return, volatility_window)
+    
+    moving_averages = np.empty((len(ma_periods), n))
+    for j in range(len(ma_periods)):
+        moving_averages[j] = rolling_mean(close, ma_periods[j])
+    
+    rsi_values = rsi(close, rsi_period)
+    bollinger_upper, bollinger_lower = bollinger(close, bb_period, bb_std)
+    macd_line, signal_line, histogram = macd(close, macd_fast, macd_slow, macd_signal)
+    stoch_k, stoch_d = stoch(high, low, close, stoch_k_period, stoch_d_period)
+    williams = williams_r(high, low, close, williams_r_period)
+    
+    return (daily_return, volatility, moving_averages, rsi_values, bollinger_upper,
+            bollinger_lower, macd_line, signal_line, histogram, stoch_k, stoch_d, williams)
+
+
+@lru_cache(maxsize=None)
+def make_indicator_kernel(ma_periods: Tuple[int, ...], volatility_window: int, rsi_period: int,
+                          bb_period: int, bb_std: float, macd_fast: int, macd_slow: int,
+                          macd_signal: int, stoch_k_period: int, stoch_d_period: int,
+                          williams_r_period: int) -> Callable:
+    """Build a `compute_all` kernel specialised for one indicator configuration.
+    
+    The periods are closure constants that numba freezes into the compiled code,
+    so the returned kernel only takes (close, high, low). Kernels are cached per
+    configuration (numba's on-disk cache keys on the closure values too) and
+    compiled eagerly for contiguous float64 arrays.
+    """
+    ma_array = np.array(ma_periods, dtype=np.int64)
+    bb_std = float(bb_std)
+    
+    @njit(cache=True, error_model='numpy')
+    def kernel(close, high, low):
+        return compute_all(close, high, low, ma_array, volatility_window, rsi_period,
+                           bb_period, bb_std, macd_fast, macd_slow, macd_signal,
+                           stoch_k_period, stoch_d_period, williams_r_period)
+    
+    if NUMBA_AVAILABLE:
+        kernel.compile((types.float64[::1],) * 3)
+    return kernel
@@ -3,13 +3,23 @@ Structured data collection for FinTech Data Curator
 Handles OHLCV data and technical indicators
 """
 
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
 from .utils import safe_float, setup_logging
+from . import indicators_numba
+from .indicators_numba import NUMBA_AVAILABLE
 
 # Phase 1 Enhancement: Try to import pandas_ta for advanced indicators
 try:
@@ -18,12 +28,87 @@ try:
 except ImportError:
     PANDAS_TA_AVAILABLE = False
 
+# Optional: SciPy IIR filter for EMAs when numba is unavailable
+try:
+    from scipy.signal import lfilter
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Optional: TA-Lib C rolling primitives when numba is unavailable
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+# Optional: pyarrow for the on-disk frame cache (in-process cache only without it)
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Raw yfinance history and enhanced frames shared by all collectors in the process:
+# key -> (fetched_at, frame)
+_HISTORY_MEMO: "OrderedDict[str, Tuple[float, pd.DataFrame]]" = OrderedDict()
+_HISTORY_MEMO_LOCK = threading.Lock()
+
+@dataclass
+class Ohlcv:
+    """Contiguous float64 OHLCV arrays handed to the indicator kernels."""
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    index: pd.Index
+    
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'Ohlcv':
+        """Extract the price columns once so kernels never touch the DataFrame."""
+        def column(name: str) -> np.ndarray:
+            return np.ascontiguousarray(df[name].to_numpy(np.float64))
+        
+        return cls(
+            open=column('open'),
+            high=column('high'),
+            low=column('low'),
+            close=column('close'),
+            volume=column('volume'),
+            index=df.index
+        )
+
 class StructuredDataCollector:
     """Collector for structured financial data (OHLCV + technical indicators)."""
     
     def __init__(self, config):
         self.config = config
         self.logger = setup_logging()
+        
+        # Compile the indicator kernel for this configuration up front
+        if NUMBA_AVAILABLE:
+            try:
+                self._get_indicator_kernel()
+            except Exception as e:
+                self.logger.warning(f"Could not precompile indicator kernel: {e}")
+    
+    def _get_indicator_kernel(self):
+        """Get the fused indicator kernel specialised for the current configuration."""
+        indicator_config = self.config.technical_indicators
+        return indicators_numba.make_indicator_kernel(
+            tuple(indicator_config['moving_averages']),
+            indicator_config['volatility_window'],
+            indicator_config['rsi_period'],
+            indicator_config['bollinger_period'],
+            float(indicator_config['bollinger_std']),
+            indicator_config['macd_fast'],
+            indicator_config['macd_slow'],
+            indicator_config['macd_signal'],
+            indicator_config['stoch_k_period'],
+            indicator_config['stoch_d_period'],
+            indicator_config['williams_r_period']
+        )
     
     def collect_price_data(self, symbol: str, exchange: str, days: int) -> pd.DataFrame:
         """Collect historical price data for a symbol."""
@@ -37,36 +122,30 @@ class StructuredDataCollector:
             
             self.logger.info(f"Fetching price data for {formatted_symbol}")
             
-            # Fetch data using yfinance
-            ticker = yf.Ticker(formatted_symbol)
-            price_data = ticker.history(
-                start=start_date.strftime('%Y-%m-%d'),
-                end=end_date.strftime('%Y-%m-%d'),
-                interval='1d'
+            # Fetch data using yfinance (served from the history cache when fresh);
+            # yfinance takes dates directly and `end` is exclusive, so today's
+            # partial bar is never included
+            start = start_date.date()
+            end = end_date.date()
+            price_data = self._cached_frame(
+                f"{formatted_symbol}|{start}|{end}|1d",
+                lambda: yf.Ticker(formatted_symbol).history(start=start, end=end, interval='1d'),
+                self.config.price_cache['max_age']
             )
             
             if price_data.empty:
                 raise ValueError(f"No price data found for {formatted_symbol}")
             
-            # Rename columns to lowercase
-            price_data.columns = [col.lower() for col in price_data.columns]
-            
-            # Reset index to make date a column
-            price_data.reset_index(inplace=True)
+            # Date column from the DatetimeIndex: tz-naive datetime64 midnights
+            # (the exchange's calendar date) so reductions stay vectorized
+            dates = pd.DatetimeIndex(price_data.index)
+            if dates.tz is not None:
+                dates = dates.tz_localize(None)
             
-            # Ensure the date column is properly named
-            if 'Date' in price_data.columns:
-                price_data.rename(columns={'Date': 'date'}, inplace=True)
-            elif price_data.index.name == 'Date':
-                price_data.reset_index(inplace=True)
-                price_data.rename(columns={'Date': 'date'}, inplace=True)
-            
-            # Convert date to proper format
-            if 'date' in price_data.columns:
-                price_data['date'] = pd.to_datetime(price_data['date']).dt.date
-            else:
-                # If no date column exists, use the index
-                price_data['date'] = pd.to_datetime(price_data.index).date
+            # Rename columns to lowercase and make date the first column
+            price_data.columns = [col.lower() for col in price_data.columns]
+            price_data = price_data.reset_index(drop=True)
+            price_data.insert(0, 'date', dates.normalize())
             
             self.logger.info(f"Collected {len(price_data)} days of price data")
             return price_data
@@ -75,38 +154,66 @@ class StructuredDataCollector:
             self.logger.error(f"Error collecting price data for {symbol}: {e}")
             raise
     
-    def calculate_technical_indicators(self, price_data: pd.DataFrame) -> pd.DataFrame:
-        """Calculate technical indicators for the price data."""
+    def _cached_frame(self, key: str, fetch: Callable[[], pd.DataFrame],
+                      max_age: float) -> pd.DataFrame:
+        """Return the frame for `key` from the in-process or on-disk cache, else `fetch()` it."""
+        cache_config = self.config.price_cache
+        if not cache_config['enabled']:
+            return fetch()
+        
+        now = time.time()
+        with _HISTORY_MEMO_LOCK:
+            entry = _HISTORY_MEMO.get(key)
+            if entry is not None and now - entry[0] < max_age:
+                _HISTORY_MEMO.move_to_end(key)
+                return entry[1].copy()
+        
+        data = None
+        fetched_at = now
+        path = None
+        if PYARROW_AVAILABLE:
+            filename = hashlib.sha1(key.encode('utf-8')).hexdigest() + '.parquet'
+            path = os.path.join(cache_config['cache_dir'], filename)
+            try:
+                mtime = os.path.getmtime(path)
+                if now - mtime < max_age:
+                    data = pd.read_parquet(path)
+                    fetched_at = mtime
+            except (OSError, ValueError) as e:
+                if os.path.exists(path):
+                    self.logger.debug(f"Ignoring unreadable history cache {path}: {e}")
+        
+        if data is None:
+            data = fetch()
+            # Only cache successful responses so failures are retried
+            if data.empty:
+                return data
+            if path is not None:
+                try:
+                    os.makedirs(cache_config['cache_dir'], exist_ok=True)
+                    data.to_parquet(path, compression='zstd')
+                except Exception as e:
+                    self.logger.debug(f"Could not write history cache {path}: {e}")
+        
+        with _HISTORY_MEMO_LOCK:
+            _HISTORY_MEMO[key] = (fetched_at, data)
+            _HISTORY_MEMO.move_to_end(key)
+            while len(_HISTORY_MEMO) > cache_config['memory_entries']:
+                _HISTORY_MEMO.popitem(last=False)
+        
+        return data.copy()
+    
+    def calculate_technical_indicators(self, price_data: pd.DataFrame,
+                                       market_data: Optional[Dict] = None) -> pd.DataFrame:
+        """Calculate technical indicators for the price data.
+        
+        `market_data` reuses already fetched market-wide indicators instead of fetching them.
+        """
         try:
-            df = price_data.copy()
-            
-            # Daily returns
-            df['daily_return'] = df['close'].pct_change()
-            
-            # Volatility (10-day rolling standard deviation of returns)
-            volatility_window = self.config.technical_indicators['volatility_window']
-            df['volatility'] = df['daily_return'].rolling(window=volatility_window).std()
-            
-            # Moving averages
-            for ma_period in self.config.technical_indicators['moving_averages']:
-                df[f'ma_{ma_period}'] = df['close'].rolling(window=ma_period).mean()
-            
-            # RSI (Relative Strength Index)
-            rsi_period = self.config.technical_indicators['rsi_period']
-            df['rsi'] = self._calculate_rsi(df['close'], rsi_period)
-            
-            # Bollinger Bands
-            bb_period = self.config.technical_indicators['bollinger_period']
-            bb_std = self.config.technical_indicators['bollinger_std']
-            df['bollinger_upper'], df['bollinger_lower'] = self._calculate_bollinger_bands(
-                df['close'], bb_period, bb_std
-            )
-            
-            # Phase 1 Enhancement: Advanced technical indicators
-            df = self._calculate_advanced_indicators(df)
+            df = self._calculate_symbol_indicators(price_data)
             
             # Phase 1 Enhancement: Market-wide indicators
-            df = self._add_market_indicators(df)
+            df = self._add_market_indicators(df, market_data)
             
             self.logger.info("Technical indicators calculated successfully")
             return df
@@ -115,24 +222,125 @@ class StructuredDataCollector:
             self.logger.error(f"Error calculating technical indicators: {e}")
             raise
     
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        """Calculate Relative Strength Index."""
+    def _calculate_symbol_indicators(self, price_data: pd.DataFrame) -> pd.DataFrame:
+        """Calculate the indicators derived from the symbol's own prices (no market-wide columns)."""
+        # New columns are attached with a concat, so the caller's frame is never copied or mutated
+        if NUMBA_AVAILABLE:
+            # One compiled call computes every rolling indicator; add the columns in bulk
+            indicators = self._compute_all_indicators(Ohlcv.from_dataframe(price_data))
+            if indicators is not None:
+                return pd.concat([price_data, indicators], axis=1)
+        
+        indicators = {}
+        prices = price_data['close']
+        
+        # Daily returns, straight on the close array
+        close = prices.to_numpy(np.float64)
+        daily_return = np.full(len(close), np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(np.diff(close), close[:-1], out=daily_return[1:])
+        indicators['daily_return'] = pd.Series(daily_return, index=price_data.index)
+        
+        # Volatility (10-day rolling standard deviation of returns)
+        volatility_window = self.config.technical_indicators['volatility_window']
+        indicators['volatility'] = indicators['daily_return'].rolling(window=volatility_window).std()
+        
+        # Moving averages
+        for ma_period in self.config.technical_indicators['moving_averages']:
+            if self._use_talib(ma_period, prices):
+                indicators[f'ma_{ma_period}'] = pd.Series(talib.SMA(close, timeperiod=ma_period),
+                                                          index=price_data.index)
+            else:
+                indicators[f'ma_{ma_period}'] = prices.rolling(window=ma_period).mean()
+        
+        # RSI (Relative Strength Index)
+        rsi_period = self.config.technical_indicators['rsi_period']
+        indicators['rsi'] = self._calculate_rsi(prices, rsi_period)
+        
+        # Bollinger Bands
+        bb_period = self.config.technical_indicators['bollinger_period']
+        bb_std = self.config.technical_indicators['bollinger_std']
+        indicators['bollinger_upper'], indicators['bollinger_lower'] = self._calculate_bollinger_bands(
+            prices, bb_period, bb_std
+        )
+        
+        # Phase 1 Enhancement: Advanced technical indicators
+        indicators.update(self._calculate_advanced_indicators(price_data))
+        
+        return pd.concat([price_data, pd.DataFrame(indicators, index=price_data.index)], axis=1)
+    
+    @staticmethod
+    def _use_talib(period: int, *series: pd.Series) -> bool:
+        """Check whether TA-Lib can stand in for a pandas rolling window."""
+        # TA-Lib does not skip NaNs and rejects windows shorter than 2
+        return TALIB_AVAILABLE and period >= 2 and not any(s.isna().any() for s in series)
+    
+    def _rolling_high_low(self, high: pd.Series, low: pd.Series, period: int) -> Tuple[pd.Series, pd.Series]:
+        """Rolling highest high and lowest low over `period` bars."""
+        if self._use_talib(period, high, low):
+            highest_high = talib.MAX(high.to_numpy(np.float64), timeperiod=period)
+            lowest_low = talib.MIN(low.to_numpy(np.float64), timeperiod=period)
+            return pd.Series(highest_high, index=high.index), pd.Series(lowest_low, index=low.index)
+        
+        return high.rolling(window=period).max(), low.rolling(window=period).min()
+    
+    def _compute_all_indicators(self, ohlcv: Ohlcv) -> Optional[pd.DataFrame]:
+        """Compute all technical indicator columns with the fused numba kernel."""
         try:
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+            ma_periods = self.config.technical_indicators['moving_averages']
             
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
+            (daily_return, volatility, moving_averages, rsi, bollinger_upper, bollinger_lower,
+             macd_line, signal_line, histogram, stoch_k, stoch_d, williams_r) = self._get_indicator_kernel()(
+                ohlcv.close, ohlcv.high, ohlcv.low
+            )
+            
+            # Same column order as the per-indicator path
+            columns = {'daily_return': daily_return, 'volatility': volatility}
+            for ma_period, moving_average in zip(ma_periods, moving_averages):
+                columns[f'ma_{ma_period}'] = moving_average
+            columns.update({
+                'rsi': rsi,
+                'bollinger_upper': bollinger_upper,
+                'bollinger_lower': bollinger_lower,
+                'macd': macd_line,
+                'macd_signal': signal_line,
+                'macd_histogram': histogram,
+                'stoch_k': stoch_k,
+                'stoch_d': stoch_d,
+                'williams_r': williams_r
+            })
             
-            return rsi
+            return pd.DataFrame(columns, index=ohlcv.index)
             
-        except Exception:
-            # Return series of NaN if calculation fails
-            return pd.Series([np.nan] * len(prices), index=prices.index)
+        except Exception as e:
+            self.logger.warning(f"Fused indicator kernel failed, using per-indicator path: {e}")
+            return None
+    
+    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
+        """Calculate Relative Strength Index (Wilder's smoothing)."""
+        # Too few prices to fill a single window: every value would be NaN
+        if len(prices) < period:
+            return pd.Series(np.nan, index=prices.index)
+        
+        if NUMBA_AVAILABLE:
+            rsi = indicators_numba.rsi(prices.to_numpy(np.float64), period)
+            return pd.Series(rsi, index=prices.index)
+        
+        # Wilder's smoothing: EWM with alpha = 1 / period
+        delta = prices.diff()
+        gain = (delta.where(delta > 0, 0)).ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+        loss = (-delta.where(delta < 0, 0)).ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+        
+        rs = gain / loss
+        rsi = 100 - (100 / (1 + rs))
+        
+        return rsi
     
-    def _calculate_advanced_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate advanced technical indicators (MACD, Stochastic, Williams %R)."""
+    def _calculate_advanced_indicators(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """Calculate advanced technical indicators (MACD, Stochastic, Williams %R).
+        
+        Returns the new columns keyed by name so the caller can attach them in bulk.
+        """
         try:
             # MACD (Moving Average Convergence Divergence)
             macd_data = self._calculate_macd(
@@ -141,9 +349,6 @@ class StructuredDataCollector:
                 self.config.technical_indicators['macd_slow'],
                 self.config.technical_indicators['macd_signal']
             )
-            df['macd'] = macd_data['macd']
-            df['macd_signal'] = macd_data['signal']
-            df['macd_histogram'] = macd_data['histogram']
             
             # Stochastic Oscillator
             stoch_data = self._calculate_stochastic(
@@ -151,135 +356,231 @@ class StructuredDataCollector:
                 self.config.technical_indicators['stoch_k_period'],
                 self.config.technical_indicators['stoch_d_period']
             )
-            df['stoch_k'] = stoch_data['k']
-            df['stoch_d'] = stoch_data['d']
             
             # Williams %R
-            df['williams_r'] = self._calculate_williams_r(
+            williams_r = self._calculate_williams_r(
                 df['high'], df['low'], df['close'],
                 self.config.technical_indicators['williams_r_period']
             )
             
-            return df
+            return {
+                'macd': macd_data['macd'],
+                'macd_signal': macd_data['signal'],
+                'macd_histogram': macd_data['histogram'],
+                'stoch_k': stoch_data['k'],
+                'stoch_d': stoch_data['d'],
+                'williams_r': williams_r
+            }
             
         except Exception as e:
             self.logger.warning(f"Error calculating advanced indicators: {e}")
             # Add NaN columns if calculation fails
-            for col in ['macd', 'macd_signal', 'macd_histogram', 'stoch_k', 'stoch_d', 'williams_r']:
-                df[col] = np.nan
-            return df
+            nan_series = pd.Series(np.nan, index=df.index)
+            return dict.fromkeys(['macd', 'macd_signal', 'macd_histogram', 'stoch_k', 'stoch_d', 'williams_r'],
+                                 nan_series)
     
     def _calculate_macd(self, prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict:
         """Calculate MACD indicator."""
-        try:
-            # Calculate exponential moving averages
-            ema_fast = prices.ewm(span=fast).mean()
-            ema_slow = prices.ewm(span=slow).mean()
-            
-            # MACD line
-            macd_line = ema_fast - ema_slow
-            
-            # Signal line
-            signal_line = macd_line.ewm(span=signal).mean()
-            
-            # Histogram
-            histogram = macd_line - signal_line
-            
+        if NUMBA_AVAILABLE:
+            macd_line, signal_line, histogram = indicators_numba.macd(
+                prices.to_numpy(np.float64), fast, slow, signal
+            )
             return {
-                'macd': macd_line,
-                'signal': signal_line,
-                'histogram': histogram
+                'macd': pd.Series(macd_line, index=prices.index),
+                'signal': pd.Series(signal_line, index=prices.index),
+                'histogram': pd.Series(histogram, index=prices.index)
             }
-            
-        except Exception:
-            nan_series = pd.Series([np.nan] * len(prices), index=prices.index)
-            return {'macd': nan_series, 'signal': nan_series, 'histogram': nan_series}
+        
+        if SCIPY_AVAILABLE and not prices.isna().any():
+            close = prices.to_numpy(np.float64)
+            macd_line = self._ema(close, fast) - self._ema(close, slow)
+            signal_line = self._ema(macd_line, signal)
+            return {
+                'macd': pd.Series(macd_line, index=prices.index),
+                'signal': pd.Series(signal_line, index=prices.index),
+                'histogram': pd.Series(macd_line - signal_line, index=prices.index)
+            }
+        
+        # Calculate exponential moving averages
+        ema_fast = prices.ewm(span=fast).mean()
+        ema_slow = prices.ewm(span=slow).mean()
+        
+        # MACD line
+        macd_line = ema_fast - ema_slow
+        
+        # Signal line
+        signal_line = macd_line.ewm(span=signal).mean()
+        
+        # Histogram
+        histogram = macd_line - signal_line
+        
+        return {
+            'macd': macd_line,
+            'signal': signal_line,
+            'histogram': histogram
+        }
+    
+    @staticmethod
+    def _ema(values: np.ndarray, span: int) -> np.ndarray:
+        """EMA matching pandas `ewm(span=span).mean()` for NaN-free input, via an IIR filter."""
+        # adjust=True divides the decayed sum of values by the decayed sum of weights
+        decay = 1 - 2 / (span + 1)
+        weighted_sum = lfilter([1.0], [1.0, -decay], values)
+        weight_sum = lfilter([1.0], [1.0, -decay], np.ones_like(values))
+        return weighted_sum / weight_sum
     
     def _calculate_stochastic(self, high: pd.Series, low: pd.Series, close: pd.Series, 
                             k_period: int = 14, d_period: int = 3) -> Dict:
         """Calculate Stochastic Oscillator."""
-        try:
-            # Calculate %K
-            lowest_low = low.rolling(window=k_period).min()
-            highest_high = high.rolling(window=k_period).max()
-            
-            k_percent = 100 * ((close - lowest_low) / (highest_high - lowest_low))
-            
-            # Calculate %D (moving average of %K)
-            d_percent = k_percent.rolling(window=d_period).mean()
-            
-            return {'k': k_percent, 'd': d_percent}
-            
-        except Exception:
-            nan_series = pd.Series([np.nan] * len(close), index=close.index)
+        # Too few bars to fill a single %K window: every value would be NaN
+        if len(close) < k_period:
+            nan_series = pd.Series(np.nan, index=close.index)
             return {'k': nan_series, 'd': nan_series}
+        
+        if NUMBA_AVAILABLE:
+            k_percent, d_percent = indicators_numba.stoch(
+                high.to_numpy(np.float64), low.to_numpy(np.float64),
+                close.to_numpy(np.float64), k_period, d_period
+            )
+            return {
+                'k': pd.Series(k_percent, index=close.index),
+                'd': pd.Series(d_percent, index=close.index)
+            }
+        
+        # Calculate %K
+        highest_high, lowest_low = self._rolling_high_low(high, low, k_period)
+        
+        # A flat window has no range; report NaN rather than inf
+        price_range = (highest_high - lowest_low).replace(0, np.nan)
+        k_percent = 100 * ((close - lowest_low) / price_range)
+        
+        # Calculate %D (moving average of %K)
+        d_percent = k_percent.rolling(window=d_period).mean()
+        
+        return {'k': k_percent, 'd': d_percent}
     
     def _calculate_williams_r(self, high: pd.Series, low: pd.Series, close: pd.Series, 
                             period: int = 14) -> pd.Series:
         """Calculate Williams %R indicator."""
-        try:
-            highest_high = high.rolling(window=period).max()
-            lowest_low = low.rolling(window=period).min()
-            
-            williams_r = -100 * ((highest_high - close) / (highest_high - lowest_low))
-            
-            return williams_r
-            
-        except Exception:
-            return pd.Series([np.nan] * len(close), index=close.index)
+        # Too few bars to fill a single window: every value would be NaN
+        if len(close) < period:
+            return pd.Series(np.nan, index=close.index)
+        
+        if NUMBA_AVAILABLE:
+            williams_r = indicators_numba.williams_r(
+                high.to_numpy(np.float64), low.to_numpy(np.float64),
+                close.to_numpy(np.float64), period
+            )
+            return pd.Series(williams_r, index=close.index)
+        
+        highest_high, lowest_low = self._rolling_high_low(high, low, period)
+        
+        # A flat window has no range; report NaN rather than inf
+        price_range = (highest_high - lowest_low).replace(0, np.nan)
+        williams_r = -100 * ((highest_high - close) / price_range)
+        
+        return williams_r
     
-    def _add_market_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _add_market_indicators(self, df: pd.DataFrame, market_data: Optional[Dict] = None) -> pd.DataFrame:
         """Add market-wide indicators for context."""
+        # NaN values unless market data is available
+        columns = dict.fromkeys(['vix', 'dxy', 'treasury_10y', 'sp500_correlation'], np.nan)
+        
         try:
             # Get market indicators from config
-            market_data = self._fetch_market_indicators()
+            if market_data is None:
+                market_data = self._fetch_market_indicators()
             
-            # Add market indicators to dataframe
             if market_data:
                 # Get the latest values for each market indicator
-                df['vix'] = market_data.get('vix', np.nan)
-                df['dxy'] = market_data.get('dxy', np.nan)
-                df['treasury_10y'] = market_data.get('treasury_10y', np.nan)
+                columns['vix'] = market_data.get('vix', np.nan)
+                columns['dxy'] = market_data.get('dxy', np.nan)
+                columns['treasury_10y'] = market_data.get('treasury_10y', np.nan)
                 
                 # Calculate correlation with S&P 500
                 if 'sp500' in market_data and not df.empty:
-                    sp500_change = market_data.get('sp500_change', 0)
-                    stock_change = df['daily_return'].iloc[-1] if not df['daily_return'].isna().all() else 0
-                    df['sp500_correlation'] = sp500_change * stock_change  # Simple correlation proxy
-                else:
-                    df['sp500_correlation'] = np.nan
-            else:
-                # Add NaN values if market data unavailable
-                for col in ['vix', 'dxy', 'treasury_10y', 'sp500_correlation']:
-                    df[col] = np.nan
-            
-            return df
+                    columns['sp500_correlation'] = self._calculate_sp500_correlation(df)
             
         except Exception as e:
             self.logger.warning(f"Error adding market indicators: {e}")
             # Add NaN columns if market data fails
-            for col in ['vix', 'dxy', 'treasury_10y', 'sp500_correlation']:
-                df[col] = np.nan
-            return df
+            columns = dict.fromkeys(columns, np.nan)
+        
+        # Attach all market columns in one step
+        return pd.concat([df, pd.DataFrame(columns, index=df.index)], axis=1)
+    
+    def _calculate_sp500_correlation(self, df: pd.DataFrame) -> pd.Series:
+        """Rolling correlation between the stock's and the S&P 500's daily returns."""
+        try:
+            window = self.config.technical_indicators['correlation_window']
+            symbol = self.config.market_indicators['sp500']
+            
+            # S&P 500 history over the same dates (end is exclusive, like collect_price_data)
+            dates = pd.DatetimeIndex(pd.to_datetime(df['date']))
+            start = dates.min().strftime('%Y-%m-%d')
+            end = (dates.max() + timedelta(days=1)).strftime('%Y-%m-%d')
+            history = self._cached_frame(
+                f"{symbol}|{start}|{end}|1d",
+                lambda: yf.Ticker(symbol).history(start=start, end=end, interval='1d'),
+                self.config.price_cache['max_age']
+            )
+            if history.empty:
+                return pd.Series(np.nan, index=df.index)
+            
+            # Align closes on the stock's dates; days the index did not trade
+            # (e.g. crypto weekends) carry the last close forward
+            sp500_close = pd.Series(history['Close'].to_numpy(np.float64),
+                                    index=pd.DatetimeIndex(history.index.date))
+            sp500_close = sp500_close[~sp500_close.index.duplicated(keep='last')]
+            aligned = sp500_close.reindex(dates, method='ffill').to_numpy(np.float64)
+            
+            sp500_return = np.full(len(aligned), np.nan)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                np.divide(np.diff(aligned), aligned[:-1], out=sp500_return[1:])
+            stock_return = df['daily_return'].to_numpy(np.float64)
+            
+            if NUMBA_AVAILABLE:
+                correlation = indicators_numba.rolling_corr(stock_return, sp500_return, window)
+                return pd.Series(correlation, index=df.index)
+            
+            return pd.Series(stock_return, index=df.index).rolling(window=window).corr(
+                pd.Series(sp500_return, index=df.index)
+            )
+            
+        except Exception as e:
+            self.logger.debug(f"Failed to calculate S&P 500 correlation: {e}")
+            return pd.Series(np.nan, index=df.index)
     
     def _fetch_market_indicators(self) -> Dict:
         """Fetch current market-wide indicators."""
         try:
             market_data = {}
             
+            # Fetch all indicator tickers in a single batched request
+            batch_history = self._download_market_history(self.config.get_all_indicator_symbols())
+            today = datetime.now().strftime('%Y-%m-%d')
+            
             # Fetch key market indicators
             for indicator, symbol in self.config.market_indicators.items():
                 try:
-                    ticker = yf.Ticker(symbol)
-                    data = ticker.history(period='5d')
+                    data = batch_history.get(symbol)
+                    if data is None:
+                        # Fall back to a per-symbol request if the batch missed this ticker
+                        data = self._cached_frame(
+                            f"{symbol}|5d|{today}",
+                            lambda: yf.Ticker(symbol).history(period='5d'),
+                            self.config.price_cache['market_max_age']
+                        )
+                    
+                    closes = data['Close'].dropna() if not data.empty else data
                     
-                    if not data.empty:
-                        latest_close = data['Close'].iloc[-1]
+                    if not closes.empty:
+                        latest_close = closes.iloc[-1]
                         market_data[indicator] = round(float(latest_close), 4)
                         
                         # Calculate change for S&P 500
-                        if indicator == 'sp500' and len(data) >= 2:
-                            prev_close = data['Close'].iloc[-2]
+                        if indicator == 'sp500' and len(closes) >= 2:
+                            prev_close = closes.iloc[-2]
                             change = (latest_close - prev_close) / prev_close
                             market_data['sp500_change'] = round(float(change), 6)
                             
@@ -294,47 +595,108 @@ class StructuredDataCollector:
             self.logger.warning(f"Error fetching market indicators: {e}")
             return {}
     
-    def _calculate_bollinger_bands(self, prices: pd.Series, period: int = 20, 
-                                 std_dev: float = 2) -> Tuple[pd.Series, pd.Series]:
-        """Calculate Bollinger Bands."""
+    def _download_market_history(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """Get recent history for several tickers, keyed by ticker.
+        
+        Cached tickers are served from the history cache; the first miss triggers
+        one batched download whose frames fill the remaining misses.
+        """
+        today = datetime.now().strftime('%Y-%m-%d')
+        max_age = self.config.price_cache['market_max_age']
+        batch = {}
+        
+        def fetch(symbol: str) -> pd.DataFrame:
+            if 'history' not in batch:
+                batch['history'] = self._download_market_batch(symbols)
+            return batch['history'].get(symbol, pd.DataFrame())
+        
+        history = {}
+        for symbol in symbols:
+            data = self._cached_frame(f"{symbol}|5d|{today}", lambda: fetch(symbol), max_age)
+            if not data.empty:
+                history[symbol] = data
+        return history
+    
+    def _download_market_batch(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """Download recent history for several tickers in one request, keyed by ticker."""
         try:
-            sma = prices.rolling(window=period).mean()
-            std = prices.rolling(window=period).std()
+            data = yf.download(
+                tickers=" ".join(symbols),
+                period='5d',
+                interval='1d',
+                group_by='ticker',
+                threads=True,
+                progress=False
+            )
             
-            upper_band = sma + (std * std_dev)
-            lower_band = sma - (std * std_dev)
+            if data is None or data.empty:
+                return {}
             
-            return upper_band, lower_band
+            available = set(data.columns.get_level_values(0))
+            return {symbol: data[symbol] for symbol in symbols if symbol in available}
             
-        except Exception:
-            # Return series of NaN if calculation fails
-            nan_series = pd.Series([np.nan] * len(prices), index=prices.index)
+        except Exception as e:
+            self.logger.debug(f"Batched market indicator download failed: {e}")
+            return {}
+    
+    def _calculate_bollinger_bands(self, prices: pd.Series, period: int = 20, 
+                                 std_dev: float = 2) -> Tuple[pd.Series, pd.Series]:
+        """Calculate Bollinger Bands."""
+        # Too few prices to fill a single window: every value would be NaN
+        if len(prices) < period:
+            nan_series = pd.Series(np.nan, index=prices.index)
             return nan_series, nan_series
+        
+        if NUMBA_AVAILABLE:
+            upper_band, lower_band = indicators_numba.bollinger(
+                prices.to_numpy(np.float64), period, float(std_dev)
+            )
+            return pd.Series(upper_band, index=prices.index), pd.Series(lower_band, index=prices.index)
+        
+        sma = prices.rolling(window=period).mean()
+        std = prices.rolling(window=period).std()
+        
+        upper_band = sma + (std * std_dev)
+        lower_band = sma - (std * std_dev)
+        
+        return upper_band, lower_band
     
-    def get_latest_data(self, symbol: str, exchange: str, days: int) -> pd.DataFrame:
+    def get_latest_data(self, symbol: str, exchange: str, days: int,
+                        market_data: Optional[Dict] = None) -> pd.DataFrame:
         """Get the latest structured data with specified number of days."""
         try:
-            # Collect raw price data
-            price_data = self.collect_price_data(symbol, exchange, days)
-            
-            # Calculate technical indicators
-            enhanced_data = self.calculate_technical_indicators(price_data)
-            
-            # Get only the most recent 'days' worth of data
-            latest_data = enhanced_data.tail(days).copy()
+            # Collect raw price data and calculate technical indicators; the symbol's own
+            # indicators are cached per symbol, day and indicator settings like the daily
+            # bars they come from. Live market indicators are joined after the lookup so
+            # the cache never holds market values or depends on the caller's market_data.
+            formatted_symbol = self.config.get_symbol_with_suffix(symbol, exchange)
+            indicator_settings = json.dumps(self.config.technical_indicators, sort_keys=True)
+            symbol_data = self._cached_frame(
+                f"indicators|{formatted_symbol}|{days}|{datetime.now():%Y-%m-%d}|{indicator_settings}",
+                lambda: self._calculate_symbol_indicators(
+                    self.collect_price_data(symbol, exchange, days)
+                ),
+                self.config.price_cache['max_age']
+            )
+            enhanced_data = self._add_market_indicators(symbol_data, market_data)
             
-            # Select only the configured features
+            # Select only the configured features for the most recent 'days' worth of data
             feature_columns = ['date'] + self.config.features['structured']
-            available_columns = [col for col in feature_columns if col in latest_data.columns]
+            available_columns = [col for col in feature_columns if col in enhanced_data.columns]
             
-            result = latest_data[available_columns].copy()
+            result = enhanced_data[available_columns].tail(days).copy()
             
-            # Round numerical values for cleaner output
-            numeric_columns = result.select_dtypes(include=[np.number]).columns
-            result[numeric_columns] = result[numeric_columns].round(4)
+            # Round and NaN-fill the float block in one numpy pass; integer columns
+            # (volume) are unaffected by rounding and cannot hold NaN
+            float_columns = result.select_dtypes(include=[np.floating]).columns
+            values = result[float_columns].to_numpy(np.float64, copy=True)
+            np.round(values, 4, out=values)
+            values[np.isnan(values)] = 0.0
+            result[float_columns] = values
             
             # Fill NaN values with appropriate defaults
-            result = result.fillna(0)
+            other_columns = result.columns.difference(float_columns, sort=False)
+            result[other_columns] = result[other_columns].fillna(0)
             
             self.logger.info(f"Prepared {len(result)} days of structured data")
             return result
@@ -343,11 +705,44 @@ class StructuredDataCollector:
             self.logger.error(f"Error getting latest structured data: {e}")
             raise
     
+    def collect_many(self, pairs: List[Tuple[str, str]], days: int,
+                     max_workers: int = 8) -> Dict[Tuple[str, str], pd.DataFrame]:
+        """Get the latest structured data for several (symbol, exchange) pairs concurrently.
+        
+        Results are keyed by the (symbol, exchange) pair, so one symbol listed on
+        several exchanges keeps a frame per exchange.
+        """
+        if not pairs:
+            return {}
+        
+        # Market-wide indicators are shared by every symbol; fetch them once for the batch
+        market_data = self._fetch_market_indicators()
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as executor:
+            futures = {
+                executor.submit(self.get_latest_data, symbol, exchange, days, market_data): (symbol, exchange)
+                for symbol, exchange in pairs
+            }
+            for future in as_completed(futures):
+                symbol, exchange = futures[future]
+                try:
+                    results[(symbol, exchange)] = future.result()
+                except Exception as e:
+                    # get_latest_data already logged the cause; keep the other symbols
+                    self.logger.warning(f"Skipping {symbol} ({exchange}): {e}")
+        
+        self.logger.info(f"Collected structured data for {len(results)}/{len(pairs)} symbols")
+        return results
+    
     def validate_data_quality(self, data: pd.DataFrame) -> Dict[str, any]:
         """Validate the quality of collected structured data."""
+        # One null-mask pass feeds both the per-column counts and the total
+        missing_counts = data.isnull().sum()
+        
         quality_report = {
             'total_records': len(data),
-            'missing_values': data.isnull().sum().to_dict(),
+            'missing_values': missing_counts.to_dict(),
             'date_range': {
                 'start': data['date'].min() if not data.empty else None,
                 'end': data['date'].max() if not data.empty else None
@@ -356,7 +751,7 @@ class StructuredDataCollector:
                 'min_close': safe_float(data['close'].min()) if 'close' in data.columns else None,
                 'max_close': safe_float(data['close'].max()) if 'close' in data.columns else None
             },
-            'data_completeness': (1 - data.isnull().sum().sum() / (len(data) * len(data.columns))) * 100
+            'data_completeness': (1 - missing_counts.sum() / (len(data) * len(data.columns))) * 100
         }
         
         return quality_report
\ No newline at end of file
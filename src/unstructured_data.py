@@ -3,41 +3,127 @@ Unstructured data collection for FinTech Data Curator
 Handles news data and sentiment analysis
 """
 
+import os
+import json
+import hashlib
+import heapq
+import time
 import requests
 from bs4 import BeautifulSoup
 import feedparser
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional
-import logging
-import time
-import re
-from textblob import TextBlob
-from .utils import safe_request, clean_text, calculate_relevance_score, setup_logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from .utils import safe_request_batch, clean_text, calculate_relevance_scores, setup_logging
+from .utils import compile_keyword_pattern, create_robust_session
+
+# Financial keywords a scraped Yahoo headline must mention, as one compiled alternation
+_FINANCIAL_KEYWORD_PATTERN = compile_keyword_pattern([
+    'stock', 'market', 'price', 'trading', 'shares', 'earnings', 'revenue', 'profit', 'loss', 'investment'
+])
+
+# Yahoo Finance headline selectors, joined so the page is walked once
+_YAHOO_HEADLINE_SELECTOR = ', '.join([
+    'h3[data-test-locator="headline"]',
+    'h3[class*="headline"]',
+    'h4[class*="headline"]',
+    'a[class*="story-title"]',
+    'div[class*="story"] h3',
+    'div[class*="news"] h3',
+    'li[class*="stream-item"] h3',
+    'div[data-module="stream"] h3',
+    '[data-test-locator="stream"] h3'
+])
+
+@dataclass
+class Article:
+    """A collected news item, before relevance and sentiment scoring."""
+    __slots__ = ('headline', 'summary', 'source', 'date', 'url')
+    headline: str
+    summary: str
+    source: str
+    date: date
+    url: str
+
+@lru_cache(maxsize=None)
+def _pattern_sentiment():
+    """Import TextBlob's lexicon scorer on first use (textblob pulls in NLTK)."""
+    # Lexicon scorer behind TextBlob's default PatternAnalyzer; calling it directly
+    # skips building a TextBlob (and a result namedtuple) per headline
+    from textblob.en import sentiment
+    return sentiment
+
+# FinBERT label -> polarity sign
+_FINBERT_DIRECTION = {'positive': 1, 'negative': -1, 'neutral': 0}
+
+@lru_cache(maxsize=None)
+def _finbert_pipeline(model: str):
+    """Load a transformers sentiment pipeline on first use; None if unavailable."""
+    try:
+        import torch
+        from transformers import pipeline
+    except ImportError:
+        return None
+    
+    try:
+        return pipeline('sentiment-analysis', model=model, device=0 if torch.cuda.is_available() else -1)
+    except OSError:
+        # Model weights could not be downloaded or found locally
+        return None
+
+@lru_cache(maxsize=4096)
+def _headline_polarity(text: str) -> float:
+    """Pattern-lexicon polarity, memoized since headlines repeat across feeds and runs."""
+    return _pattern_sentiment()(text)[0]
 
 class UnstructuredDataCollector:
     """Collector for unstructured financial data (news, sentiment)."""
     
-    def __init__(self, config):
+    def __init__(self, config, session: Optional[requests.Session] = None):
         self.config = config
         self.logger = setup_logging()
+        
+        # Shared pooled (optionally cached) session. Standalone collectors get their
+        # own pooled session so every Yahoo/RSS request reuses keep-alive connections
+        if session is None:
+            session = create_robust_session(
+                retries=self.config.scraping['max_retries'],
+                pool_maxsize=self.config.scraping['pool_maxsize']
+            )
+            session.headers.update(self.config.get_headers())
+        self.session = session
+        
+        # Conditional-GET validators per feed URL, loaded on first RSS fetch
+        self._rss_validators = None
+        
+        # Parsed CoinDesk feed as (fetched_at, entries); it is symbol-independent
+        self._coindesk_feed = None
     
     def collect_news_data(self, symbol: str, exchange: str, days: int) -> List[Dict]:
         """Collect news data for a symbol from multiple sources."""
         try:
             news_articles = []
             
-            # Try RSS feeds first (more reliable)
-            rss_news = self._get_rss_financial_news(symbol, days)
-            news_articles.extend(rss_news)
-            
-            # Yahoo Finance News (with improved scraping)
-            yahoo_news = self._get_yahoo_finance_news(symbol, days)
-            news_articles.extend(yahoo_news)
-            
-            # CoinDesk for crypto
-            if exchange == 'CRYPTO':
-                coindesk_news = self._get_coindesk_news(symbol, days)
-                news_articles.extend(coindesk_news)
+            # The sources are independent and network-bound: query them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                # Try RSS feeds first (more reliable)
+                rss_future = executor.submit(self._get_rss_financial_news, symbol, days)
+                
+                # Yahoo Finance News (with improved scraping)
+                yahoo_future = executor.submit(self._get_yahoo_finance_news, symbol, days)
+                
+                # CoinDesk for crypto
+                coindesk_future = None
+                if exchange == 'CRYPTO':
+                    coindesk_future = executor.submit(self._get_coindesk_news, symbol, days)
+                
+                # Keep the original source order in the combined list
+                news_articles.extend(rss_future.result())
+                news_articles.extend(yahoo_future.result())
+                if coindesk_future is not None:
+                    news_articles.extend(coindesk_future.result())
             
             # Filter and process news
             processed_news = self._process_news_articles(news_articles, symbol, days)
@@ -49,7 +135,7 @@ class UnstructuredDataCollector:
             self.logger.error(f"Error collecting news data: {e}")
             return []
     
-    def _get_yahoo_finance_news(self, symbol: str, days: int) -> List[Dict]:
+    def _get_yahoo_finance_news(self, symbol: str, days: int) -> List[Article]:
         """Get news from Yahoo Finance."""
         try:
             articles = []
@@ -62,33 +148,22 @@ class UnstructuredDataCollector:
             ]
             
             headers = self.config.get_headers()
+            today = datetime.now().date()
+            min_headline_length = self.config.news_filters['min_headline_length']
             
-            for search_url in news_urls:
+            # Fetch the fallback pages concurrently, then parse them in priority order
+            responses = safe_request_batch(news_urls, headers, session=self.session)
+            
+            for search_url, response in zip(news_urls, responses):
                 try:
-                    response = safe_request(search_url, headers)
                     if not response:
                         continue
                     
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Try multiple selectors for Yahoo Finance
-                    selectors = [
-                        'h3[data-test-locator="headline"]',
-                        'h3[class*="headline"]',
-                        'h4[class*="headline"]',
-                        'a[class*="story-title"]',
-                        'div[class*="story"] h3',
-                        'div[class*="news"] h3',
-                        'li[class*="stream-item"] h3',
-                        'div[data-module="stream"] h3',
-                        '[data-test-locator="stream"] h3'
-                    ]
+                    # libxml2's C parser; the selectors below need the full tree, so no SoupStrainer
+                    soup = BeautifulSoup(response.content, 'lxml')
                     
-                    news_items = []
-                    for selector in selectors:
-                        items = soup.select(selector)
-                        if items:
-                            news_items.extend(items[:10])  # Limit items per selector
+                    # All Yahoo Finance headline selectors in one document-order pass
+                    news_items = soup.select(_YAHOO_HEADLINE_SELECTOR, limit=15)
                     
                     # Also try generic headline selectors
                     if not news_items:
@@ -101,17 +176,16 @@ class UnstructuredDataCollector:
                             else:
                                 headline = clean_text(str(item))
                             
-                            if len(headline) >= self.config.news_filters['min_headline_length']:
+                            if len(headline) >= min_headline_length:
                                 # Check if headline contains financial keywords
-                                financial_keywords = ['stock', 'market', 'price', 'trading', 'shares', 'earnings', 'revenue', 'profit', 'loss', 'investment']
-                                if any(keyword in headline.lower() for keyword in financial_keywords):
-                                    article = {
-                                        'headline': headline,
-                                        'summary': headline[:200] + '...' if len(headline) > 200 else headline,
-                                        'source': 'Yahoo Finance',
-                                        'date': datetime.now().date(),
-                                        'url': search_url
-                                    }
+                                if _FINANCIAL_KEYWORD_PATTERN.search(headline.lower()):
+                                    article = Article(
+                                        headline=headline,
+                                        summary=headline[:200] + '...' if len(headline) > 200 else headline,
+                                        source='Yahoo Finance',
+                                        date=today,
+                                        url=search_url
+                                    )
                                     articles.append(article)
                                     
                         except Exception as e:
@@ -131,7 +205,7 @@ class UnstructuredDataCollector:
             self.logger.error(f"Error fetching Yahoo Finance news: {e}")
             return []
     
-    def _get_rss_financial_news(self, symbol: str, days: int) -> List[Dict]:
+    def _get_rss_financial_news(self, symbol: str, days: int) -> List[Article]:
         """Get financial news from RSS feeds."""
         try:
             articles = []
@@ -147,68 +221,30 @@ class UnstructuredDataCollector:
             for name, url in self.config.data_sources['additional_rss_feeds'].items():
                 rss_feeds.append((name.replace('_', ' ').title(), url))
             
-            cutoff_date = datetime.now() - timedelta(days=days)
+            now = datetime.now()
+            cutoff_date = now - timedelta(days=days)
             
-            for feed_name, feed_url in rss_feeds:
-                try:
-                    self.logger.debug(f"Fetching RSS feed: {feed_name} - {feed_url}")
-                    
-                    # Add timeout for RSS parsing
-                    import socket
-                    socket.setdefaulttimeout(10)
-                    
-                    feed = feedparser.parse(feed_url)
-                    
-                    if not feed.entries:
-                        self.logger.debug(f"No entries found in {feed_name}")
-                        continue
-                    
-                    for entry in feed.entries[:15]:  # Limit entries per feed
-                        try:
-                            # Parse publication date
-                            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                                pub_date = datetime(*entry.published_parsed[:6])
-                            elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                                pub_date = datetime(*entry.updated_parsed[:6])
-                            else:
-                                pub_date = datetime.now()  # Use current time if no date
-                            
-                            if pub_date >= cutoff_date:
-                                headline = clean_text(entry.title) if hasattr(entry, 'title') else ''
-                                summary = clean_text(entry.summary) if hasattr(entry, 'summary') else headline
-                                
-                                # Check if headline contains any relevant keywords
-                                if len(headline) >= self.config.news_filters['min_headline_length']:
-                                    keywords = self.config.news_filters['relevant_keywords']
-                                    headline_lower = headline.lower()
-                                    
-                                    # Check for keyword relevance
-                                    has_keywords = any(keyword in headline_lower for keyword in keywords)
-                                    
-                                    if has_keywords or feed_name.lower() in ['coindesk', 'crypto', 'fintech']:
-                                        article = {
-                                            'headline': headline,
-                                            'summary': summary[:300] + '...' if len(summary) > 300 else summary,
-                                            'source': feed_name,
-                                            'date': pub_date.date(),
-                                            'url': entry.link if hasattr(entry, 'link') else feed_url
-                                        }
-                                        articles.append(article)
-                                    
-                        except Exception as e:
-                            self.logger.debug(f"Error parsing RSS entry from {feed_name}: {e}")
-                            continue
-                            
-                except Exception as e:
-                    self.logger.debug(f"Error fetching RSS feed {feed_name}: {e}")
-                    continue
+            if self._rss_validators is None:
+                self._rss_validators = self._load_rss_validators()
+            
+            # Fetch feeds in parallel (I/O bound), keeping results in feed order
+            max_workers = min(self.config.scraping.get('rss_max_workers', 10), len(rss_feeds))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                feed_results = executor.map(
+                    lambda feed: self._fetch_rss_feed(feed[0], feed[1], cutoff_date, now), rss_feeds
+                )
+                for feed_articles in feed_results:
+                    articles.extend(feed_articles)
             
-            # Remove duplicates based on headline
+            self._save_rss_validators()
+            
+            # Remove duplicates based on headline, ignoring case and spacing differences
             seen_headlines = set()
             unique_articles = []
             for article in articles:
-                if article['headline'] not in seen_headlines:
-                    seen_headlines.add(article['headline'])
+                key = ' '.join(article.headline.casefold().split())
+                if key not in seen_headlines:
+                    seen_headlines.add(key)
                     unique_articles.append(article)
             
             self.logger.info(f"Collected {len(unique_articles)} unique articles from RSS feeds")
@@ -218,33 +254,147 @@ class UnstructuredDataCollector:
             self.logger.error(f"Error fetching RSS financial news: {e}")
             return []
     
-    def _get_coindesk_news(self, symbol: str, days: int) -> List[Dict]:
+    def _rss_cache_path(self, filename: str) -> str:
+        """Get a path inside the RSS conditional-GET cache directory."""
+        return os.path.join(self.config.http_cache['rss_cache_dir'], filename)
+    
+    def _load_rss_validators(self) -> Dict[str, Dict[str, str]]:
+        """Load stored ETag/Last-Modified validators for RSS feeds."""
+        try:
+            with open(self._rss_cache_path('rss_meta.json'), 'r', encoding='utf-8') as meta_file:
+                return json.load(meta_file)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_rss_validators(self):
+        """Persist ETag/Last-Modified validators for RSS feeds."""
+        if not self._rss_validators:
+            return
+        try:
+            os.makedirs(self.config.http_cache['rss_cache_dir'], exist_ok=True)
+            with open(self._rss_cache_path('rss_meta.json'), 'w', encoding='utf-8') as meta_file:
+                json.dump(self._rss_validators, meta_file)
+        except OSError as e:
+            self.logger.debug(f"Could not save RSS validators: {e}")
+    
+    def _fetch_feed_content(self, feed_url: str, timeout: int) -> bytes:
+        """Fetch raw feed bytes, revalidating a stored copy with a conditional GET."""
+        session = self.session
+        
+        # requests-cache already revalidates expired entries with ETag/Last-Modified
+        if getattr(session, 'cache', None) is not None or self._rss_validators is None:
+            response = session.get(feed_url, timeout=timeout)
+            response.raise_for_status()
+            return response.content
+        
+        body_path = self._rss_cache_path(hashlib.sha1(feed_url.encode('utf-8')).hexdigest() + '.xml')
+        validators = self._rss_validators.get(feed_url, {})
+        
+        headers = {}
+        if os.path.exists(body_path):
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('modified'):
+                headers['If-Modified-Since'] = validators['modified']
+        
+        response = session.get(feed_url, headers=headers, timeout=timeout)
+        
+        # Unchanged feed: the server sent no body, reuse the stored copy
+        if response.status_code == 304:
+            with open(body_path, 'rb') as body_file:
+                return body_file.read()
+        
+        response.raise_for_status()
+        
+        etag = response.headers.get('ETag')
+        modified = response.headers.get('Last-Modified')
+        if etag or modified:
+            try:
+                os.makedirs(os.path.dirname(body_path), exist_ok=True)
+                with open(body_path, 'wb') as body_file:
+                    body_file.write(response.content)
+                self._rss_validators[feed_url] = {'etag': etag, 'modified': modified}
+            except OSError as e:
+                self.logger.debug(f"Could not cache RSS feed {feed_url}: {e}")
+        
+        return response.content
+    
+    def _fetch_rss_feed(self, feed_name: str, feed_url: str, cutoff_date: datetime,
+                        now: datetime) -> List[Article]:
+        """Fetch and parse a single RSS feed."""
+        articles = []
+        try:
+            self.logger.debug(f"Fetching RSS feed: {feed_name} - {feed_url}")
+            
+            timeout = self.config.scraping.get('per_feed_timeout', 10)
+            feed = feedparser.parse(self._fetch_feed_content(feed_url, timeout))
+            
+            if not feed.entries:
+                self.logger.debug(f"No entries found in {feed_name}")
+                return articles
+            
+            min_headline_length = self.config.news_filters['min_headline_length']
+            # Crypto/fintech feeds are relevant as a whole, keywords or not
+            keep_all = feed_name.lower() in ['coindesk', 'crypto', 'fintech']
+            
+            for entry in feed.entries[:15]:  # Limit entries per feed
+                try:
+                    # Parse publication date (dict lookups skip FeedParserDict's attribute fallback)
+                    published = entry.get('published_parsed') or entry.get('updated_parsed')
+                    pub_date = datetime(*published[:6]) if published else now  # Use current time if no date
+                    
+                    if pub_date >= cutoff_date:
+                        headline = clean_text(entry.get('title', ''))
+                        summary = entry.get('summary')
+                        summary = headline if summary is None else clean_text(summary)
+                        
+                        # Check if headline contains any relevant keywords
+                        if len(headline) >= min_headline_length:
+                            # Check for keyword relevance
+                            if keep_all or self.config.match_keywords(headline):
+                                article = Article(
+                                    headline=headline,
+                                    summary=summary[:300] + '...' if len(summary) > 300 else summary,
+                                    source=feed_name,
+                                    date=pub_date.date(),
+                                    url=entry.get('link', feed_url)
+                                )
+                                articles.append(article)
+                            
+                except Exception as e:
+                    self.logger.debug(f"Error parsing RSS entry from {feed_name}: {e}")
+                    continue
+                    
+        except Exception as e:
+            self.logger.debug(f"Error fetching RSS feed {feed_name}: {e}")
+        
+        return articles
+    
+    def _get_coindesk_news(self, symbol: str, days: int) -> List[Article]:
         """Get cryptocurrency news from CoinDesk RSS feed."""
         try:
             articles = []
-            rss_url = self.config.data_sources['coindesk']['rss_url']
-            
-            # Fetch RSS feed
-            feed = feedparser.parse(rss_url)
+            entries = self._get_coindesk_entries()
             
             cutoff_date = datetime.now() - timedelta(days=days)
             
-            for entry in feed.entries[:50]:  # Limit to recent entries
+            for entry in entries:
                 try:
                     # Parse publication date
-                    pub_date = datetime(*entry.published_parsed[:6])
+                    pub_date = datetime(*entry['published_parsed'][:6])
                     
                     if pub_date >= cutoff_date:
-                        headline = clean_text(entry.title)
-                        summary = clean_text(entry.summary) if hasattr(entry, 'summary') else headline
+                        headline = clean_text(entry['title'])
+                        summary = entry.get('summary')
+                        summary = headline if summary is None else clean_text(summary)
                         
-                        article = {
-                            'headline': headline,
-                            'summary': summary,
-                            'source': 'CoinDesk',
-                            'date': pub_date.date(),
-                            'url': entry.link if hasattr(entry, 'link') else ''
-                        }
+                        article = Article(
+                            headline=headline,
+                            summary=summary,
+                            source='CoinDesk',
+                            date=pub_date.date(),
+                            url=entry.get('link', '')
+                        )
                         articles.append(article)
                         
                 except Exception as e:
@@ -257,37 +407,55 @@ class UnstructuredDataCollector:
             self.logger.error(f"Error fetching CoinDesk news: {e}")
             return []
     
-    def _process_news_articles(self, articles: List[Dict], symbol: str, days: int) -> List[Dict]:
+    def _get_coindesk_entries(self) -> List[feedparser.FeedParserDict]:
+        """Get recent CoinDesk feed entries, reusing a parse younger than coindesk_max_age."""
+        max_age = self.config.http_cache.get('coindesk_max_age', 0)
+        if self._coindesk_feed is not None and time.time() - self._coindesk_feed[0] < max_age:
+            return self._coindesk_feed[1]
+        
+        rss_url = self.config.data_sources['coindesk']['rss_url']
+        
+        # Fetch RSS feed over the shared session (pooled connections, real timeout)
+        response = self.session.get(rss_url, timeout=self.config.scraping.get('per_feed_timeout', 10))
+        response.raise_for_status()
+        entries = feedparser.parse(response.content).entries[:50]  # Limit to recent entries
+        
+        self._coindesk_feed = (time.time(), entries)
+        return entries
+    
+    def _process_news_articles(self, articles: List[Article], symbol: str, days: int) -> List[Dict]:
         """Process and filter news articles."""
         try:
             processed_articles = []
             cutoff_date = datetime.now().date() - timedelta(days=days)
             
-            for article in articles:
+            # Score relevance for all headlines in one vectorized pass
+            relevance_scores = calculate_relevance_scores(
+                [article.headline for article in articles], symbol
+            )
+            
+            for article, relevance in zip(articles, relevance_scores):
                 try:
                     # Filter by date
-                    if article['date'] < cutoff_date:
+                    if article.date < cutoff_date:
                         continue
                     
-                    # Calculate relevance score
-                    relevance = calculate_relevance_score(article['headline'], symbol)
+                    relevance = float(relevance)
                     
                     # Filter by relevance (lowered threshold to capture more news)
                     if relevance < 0.1:
                         continue
                     
-                    # Add sentiment analysis
-                    sentiment = self._analyze_sentiment(article['headline'])
-                    
-                    # Create processed article
+                    # Create processed article (plain dict: the public output shape);
+                    # sentiment is filled in below, in one batch for the kept articles
                     processed_article = {
-                        'headline': article['headline'],
-                        'summary': article['summary'],
-                        'sentiment': sentiment,
-                        'source': article['source'],
+                        'headline': article.headline,
+                        'summary': article.summary,
+                        'sentiment': 0.5,
+                        'source': article.source,
                         'relevance': relevance,
-                        'date': article['date'],
-                        'url': article.get('url', '')
+                        'date': article.date,
+                        'url': article.url
                     }
                     
                     processed_articles.append(processed_article)
@@ -296,24 +464,50 @@ class UnstructuredDataCollector:
                     self.logger.debug(f"Error processing article: {e}")
                     continue
             
-            # Sort by date (most recent first) and limit
-            processed_articles.sort(key=lambda x: x['date'], reverse=True)
+            # Most recent first, limited; a bounded heap instead of a full sort
             max_articles = self.config.news_filters['max_articles_per_day'] * days
+            processed_articles = heapq.nlargest(max_articles, processed_articles, key=lambda x: x['date'])
             
-            return processed_articles[:max_articles]
+            # Add sentiment analysis
+            sentiments = self._analyze_sentiment_batch([article['headline'] for article in processed_articles])
+            for processed_article, sentiment in zip(processed_articles, sentiments):
+                processed_article['sentiment'] = sentiment
+            
+            return processed_articles
             
         except Exception as e:
             self.logger.error(f"Error processing news articles: {e}")
             return []
     
+    def _analyze_sentiment_batch(self, headlines: List[str]) -> List[float]:
+        """Analyze sentiment of many headlines, in one FinBERT batch when enabled."""
+        if headlines and self.config.sentiment['use_finbert']:
+            classifier = _finbert_pipeline(self.config.sentiment['finbert_model'])
+            if classifier is not None:
+                try:
+                    results = classifier(headlines, batch_size=self.config.sentiment['batch_size'], truncation=True)
+                    
+                    # Signed label confidence, mapped from [-1, 1] to [0, 1] like the lexicon scores
+                    return [
+                        round((_FINBERT_DIRECTION.get(result['label'].lower(), 0) * result['score'] + 1) / 2, 3)
+                        for result in results
+                    ]
+                except Exception as e:
+                    self.logger.warning(f"FinBERT sentiment failed, falling back to TextBlob: {e}")
+        
+        return [self._analyze_sentiment(headline) for headline in headlines]
+    
     def _analyze_sentiment(self, text: str) -> float:
-        """Analyze sentiment of text using TextBlob."""
+        """Analyze sentiment of text using TextBlob's pattern lexicon."""
         try:
             if not text:
                 return 0.0
             
-            blob = TextBlob(text)
-            sentiment_polarity = blob.sentiment.polarity
+            # Too short to carry a reliable polarity signal
+            if text.count(' ') + 1 < self.config.news_filters.get('min_sentiment_words', 0):
+                return 0.5
+            
+            sentiment_polarity = _headline_polarity(text)
             
             # Convert from [-1, 1] to [0, 1] scale
             normalized_sentiment = (sentiment_polarity + 1) / 2
@@ -328,22 +522,24 @@ class UnstructuredDataCollector:
                             date_range: List[datetime]) -> Dict[str, List[Dict]]:
         """Align news articles with specific dates."""
         try:
-            aligned_news = {}
-            
-            # Initialize empty lists for each date
-            for date in date_range:
-                date_str = date.strftime(self.config.output['date_format'])
-                aligned_news[date_str] = []
+            # Bucket articles on native date objects; format only the trading dates
+            aligned_news = {
+                (date.date() if isinstance(date, datetime) else date): []
+                for date in date_range
+            }
             
             # Group news by date
             for article in news_data:
                 article_date = article['date']
-                date_str = article_date.strftime(self.config.output['date_format'])
+                if isinstance(article_date, datetime):
+                    article_date = article_date.date()
                 
-                if date_str in aligned_news:
-                    aligned_news[date_str].append(article)
+                bucket = aligned_news.get(article_date)
+                if bucket is not None:
+                    bucket.append(article)
             
-            return aligned_news
+            date_format = self.config.output['date_format']
+            return {date.strftime(date_format): articles for date, articles in aligned_news.items()}
             
         except Exception as e:
             self.logger.error(f"Error aligning news with dates: {e}")
@@ -361,9 +557,8 @@ class UnstructuredDataCollector:
                     'relevance': 0.0
                 }
             
-            # Sort by relevance and pick the best one
-            date_news.sort(key=lambda x: x['relevance'], reverse=True)
-            best_article = date_news[0]
+            # Pick the most relevant one (first wins ties) without reordering the caller's list
+            best_article = max(date_news, key=lambda x: x['relevance'])
             
             return {
                 'headline': best_article['headline'],
@@ -2,94 +2,259 @@
 Utility functions for FinTech Data Curator
 """
 
+import os
+import re
 import time
 import logging
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import pandas as pd
 import numpy as np
 
+from . import indicators_numba
+from .indicators_numba import NUMBA_AVAILABLE
+
+# Optional: persistent on-disk HTTP cache
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Optional: Aho-Corasick automaton for single-pass relevance scoring
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional: numexpr for fused elementwise arithmetic on long series
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Below this length plain pandas arithmetic beats numexpr's dispatch overhead
+NUMEXPR_MIN_ROWS = 10_000
+
 def setup_logging(level=logging.INFO):
     """Set up logging configuration."""
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('fintech_collector.log')
-        ]
-    )
+    # basicConfig ignores repeat calls, but building the handlers first would still
+    # open (and leak) a log file handle for every collector that calls this
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=level,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.StreamHandler(),
+                logging.FileHandler('fintech_collector.log', delay=True)
+            ]
+        )
     return logging.getLogger(__name__)
 
-def create_robust_session(retries: int = 3, backoff_factor: float = 0.3) -> requests.Session:
-    """Create a robust HTTP session with retry logic."""
-    session = requests.Session()
-    
+def _mount_retry_adapter(session: requests.Session, retries: int, backoff_factor: float,
+                         pool_maxsize: int) -> requests.Session:
+    """Mount a pooled HTTP adapter with retry logic on a session."""
     retry_strategy = Retry(
         total=retries,
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["HEAD", "GET", "OPTIONS"],  # Updated method name
-        backoff_factor=backoff_factor
+        backoff_factor=backoff_factor,
+        respect_retry_after_header=True,
+        raise_on_status=False  # hand back the last response; callers raise_for_status()
     )
     
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    # Keep enough pooled keep-alive connections per host for parallel fetches
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_maxsize,
+                          pool_maxsize=pool_maxsize)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     
     return session
 
+def create_robust_session(retries: int = 3, backoff_factor: float = 0.3,
+                          pool_maxsize: int = 10) -> requests.Session:
+    """Create a robust HTTP session with retry logic."""
+    return _mount_retry_adapter(requests.Session(), retries, backoff_factor, pool_maxsize)
+
+def create_cached_session(cache_name: str, expire_after: int = 900, retries: int = 3,
+                          pool_maxsize: int = 10) -> Optional[requests.Session]:
+    """Create an HTTP session backed by a persistent SQLite cache, if requests-cache is installed."""
+    if not REQUESTS_CACHE_AVAILABLE:
+        return None
+    
+    cache_dir = os.path.dirname(cache_name)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    session = requests_cache.CachedSession(
+        cache_name=cache_name,
+        backend='sqlite',
+        expire_after=expire_after,
+        allowable_methods=['GET'],
+        stale_if_error=True
+    )
+    return _mount_retry_adapter(session, retries, 0.3, pool_maxsize)
+
+# Process-wide pooled sessions (by retry count) for safe_request callers without their own
+_DEFAULT_SESSIONS: Dict[int, requests.Session] = {}
+_DEFAULT_SESSION_LOCK = threading.Lock()
+
+def get_default_session(retries: int = 3) -> requests.Session:
+    """Get the shared pooled session, creating it on first use."""
+    session = _DEFAULT_SESSIONS.get(retries)
+    if session is None:
+        with _DEFAULT_SESSION_LOCK:
+            session = _DEFAULT_SESSIONS.get(retries)
+            if session is None:
+                session = _DEFAULT_SESSIONS[retries] = create_robust_session(retries=retries, pool_maxsize=32)
+    return session
+
 def safe_request(url: str, headers: Dict[str, str], timeout: int = 30, 
-                max_retries: int = 3) -> Optional[requests.Response]:
-    """Make a safe HTTP request with error handling and retries."""
-    session = create_robust_session(retries=max_retries)
+                max_retries: int = 3, session: Optional[requests.Session] = None) -> Optional[requests.Response]:
+    """Make a safe HTTP request with error handling and retries.
     
-    for attempt in range(max_retries):
-        try:
-            response = session.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            return response
-            
-        except requests.exceptions.RequestException as e:
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Request attempt {attempt + 1} failed for {url}: {e}")
-            
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
-            else:
-                logger.error(f"All {max_retries} attempts failed for {url}")
-                
-    return None
+    Retries and backoff are done by the session's urllib3 Retry adapter;
+    max_retries picks the shared session when none is passed.
+    """
+    session = session or get_default_session(max_retries)
+    
+    try:
+        response = session.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response
+        
+    except requests.exceptions.RequestException as e:
+        logging.getLogger(__name__).error(f"Request failed for {url}: {e}")
+        return None
+
+def safe_request_batch(urls: List[str], headers: Dict[str, str], timeout: int = 30,
+                       max_retries: int = 3, session: Optional[requests.Session] = None,
+                       max_workers: int = 16) -> List[Optional[requests.Response]]:
+    """Fetch many URLs concurrently with safe_request, keeping the input order."""
+    if not urls:
+        return []
+    
+    # One pooled session for the whole batch so the workers share keep-alive sockets
+    session = session or get_default_session(max_retries)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(
+            lambda url: safe_request(url, headers, timeout, max_retries, session), urls
+        ))
 
 def clean_text(text: str) -> str:
     """Clean and normalize text data."""
     if not text:
         return ""
     
-    # Remove extra whitespace and newlines
+    # Remove extra whitespace and newlines (split() also drops \n/\r and edge spaces)
     text = " ".join(text.split())
     
     # Remove special characters that might cause CSV issues
-    text = text.replace('"', "'").replace('\n', ' ').replace('\r', ' ')
-    
-    return text.strip()
+    return text.replace('"', "'")
+
+# Basic validation - alphanumeric and common separators
+_SYMBOL_RE = re.compile(r'\A[A-Z0-9.\-]+\Z')
+_VALID_EXCHANGES = frozenset({'NYSE', 'NASDAQ', 'PSX', 'CRYPTO'})
 
 def validate_symbol(symbol: str) -> bool:
     """Validate stock/crypto symbol format."""
     if not symbol or len(symbol.strip()) == 0:
         return False
     
-    # Basic validation - alphanumeric and common separators
-    allowed_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-")
-    return all(c in allowed_chars for c in symbol.upper())
+    return _SYMBOL_RE.match(symbol.upper()) is not None
 
 def validate_exchange(exchange: str) -> bool:
     """Validate exchange name."""
-    valid_exchanges = {'NYSE', 'NASDAQ', 'PSX', 'CRYPTO'}
-    return exchange.upper() in valid_exchanges
+    return exchange.upper() in _VALID_EXCHANGES
+
+# Company name mapping (simplified)
+COMPANY_NAMES = {
+    'aapl': ['apple', 'iphone', 'ipad', 'mac', 'tim cook'],
+    'googl': ['google', 'alphabet', 'android', 'youtube', 'chrome'],
+    'msft': ['microsoft', 'windows', 'office', 'azure', 'teams'],
+    'amzn': ['amazon', 'aws', 'prime', 'bezos'],
+    'tsla': ['tesla', 'elon musk', 'electric vehicle', 'ev'],
+    'meta': ['facebook', 'instagram', 'whatsapp', 'metaverse'],
+    'nflx': ['netflix', 'streaming'],
+    'nvda': ['nvidia', 'gpu', 'ai chip'],
+    'btc': ['bitcoin', 'btc', 'cryptocurrency'],
+    'eth': ['ethereum', 'eth', 'smart contract']
+}
+
+# Sector-specific keywords for better relevance, checked in order (score, keywords)
+RELEVANCE_TIERS = [
+    # Higher relevance for market-related news
+    (0.6, ['stock', 'market', 'shares', 'trading', 'investment', 'earnings', 'revenue', 'profit']),
+    # Medium relevance for sector news (tech + finance)
+    (0.4, ['technology', 'tech', 'software', 'digital', 'ai', 'artificial intelligence',
+           'bank', 'financial', 'credit', 'loan', 'payment']),
+    # General financial news
+    (0.3, ['economy', 'economic', 'business', 'corporate', 'industry'])
+]
+
+def compile_keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """Compile keywords into a single substring-matching alternation."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+_COMPANY_PATTERNS = {symbol: compile_keyword_pattern(terms) for symbol, terms in COMPANY_NAMES.items()}
+_TIER_PATTERNS = [(score, compile_keyword_pattern(keywords)) for score, keywords in RELEVANCE_TIERS]
+
+def _build_relevance_automaton():
+    """Map every company term and tier keyword to the (score, symbol) pairs it can earn."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    entries = {}
+    for symbol, terms in COMPANY_NAMES.items():
+        for term in terms:
+            entries.setdefault(term, []).append((0.8, symbol))
+    for score, keywords in RELEVANCE_TIERS:
+        for keyword in keywords:
+            entries.setdefault(keyword, []).append((score, None))
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, scores in entries.items():
+        automaton.add_word(keyword, tuple(scores))
+    automaton.make_automaton()
+    return automaton
 
+_RELEVANCE_AUTOMATON = _build_relevance_automaton()
+
+def _keyword_relevance(headline_lower: str, symbol_lower: str) -> float:
+    """Best company-name or keyword-tier score for a lower-cased headline."""
+    if _RELEVANCE_AUTOMATON is not None:
+        # One linear scan; company terms only count for their own symbol
+        best = 0.1
+        for _, scores in _RELEVANCE_AUTOMATON.iter(headline_lower):
+            for score, owner in scores:
+                if score > best and (owner is None or owner == symbol_lower):
+                    if owner is not None:
+                        return score  # company mention is the best a keyword can earn
+                    best = score
+        return best
+    
+    # Company name mention
+    company_pattern = _COMPANY_PATTERNS.get(symbol_lower)
+    if company_pattern is not None and company_pattern.search(headline_lower):
+        return 0.8
+    
+    # Keyword tiers, one compiled regex search each
+    for score, pattern in _TIER_PATTERNS:
+        if pattern.search(headline_lower):
+            return score
+    
+    return 0.1  # Very low but not zero relevance for any news
+
+@lru_cache(maxsize=131072)  # pure in (headline, symbol); headlines recur across symbols and runs
 def calculate_relevance_score(headline: str, symbol: str) -> float:
     """Calculate relevance score of news headline to symbol."""
     if not headline or not symbol:
@@ -102,47 +267,32 @@ def calculate_relevance_score(headline: str, symbol: str) -> float:
     if symbol_lower in headline_lower:
         return 0.9
     
-    # Company name mapping (simplified)
-    company_names = {
-        'aapl': ['apple', 'iphone', 'ipad', 'mac', 'tim cook'],
-        'googl': ['google', 'alphabet', 'android', 'youtube', 'chrome'],
-        'msft': ['microsoft', 'windows', 'office', 'azure', 'teams'],
-        'amzn': ['amazon', 'aws', 'prime', 'bezos'],
-        'tsla': ['tesla', 'elon musk', 'electric vehicle', 'ev'],
-        'meta': ['facebook', 'instagram', 'whatsapp', 'metaverse'],
-        'nflx': ['netflix', 'streaming'],
-        'nvda': ['nvidia', 'gpu', 'ai chip'],
-        'btc': ['bitcoin', 'btc', 'cryptocurrency'],
-        'eth': ['ethereum', 'eth', 'smart contract']
-    }
+    return _keyword_relevance(headline_lower, symbol_lower)
+
+def calculate_relevance_scores(headlines: List[str], symbol: str) -> np.ndarray:
+    """Vectorized calculate_relevance_score over many headlines."""
+    if not symbol:
+        return np.zeros(len(headlines))
     
-    if symbol_lower in company_names:
-        for term in company_names[symbol_lower]:
-            if term in headline_lower:
-                return 0.8
+    headlines_lower = pd.Series(headlines, dtype=object).fillna('').astype(str).str.lower()
+    symbol_lower = symbol.replace('-USD', '').lower()
     
-    # Sector-specific keywords for better relevance
-    tech_keywords = ['technology', 'tech', 'software', 'digital', 'ai', 'artificial intelligence']
-    finance_keywords = ['bank', 'financial', 'credit', 'loan', 'payment']
-    market_keywords = ['stock', 'market', 'shares', 'trading', 'investment', 'earnings', 'revenue', 'profit']
+    # Conditions in priority order; np.select picks the first match per headline
+    conditions = [headlines_lower.str.contains(symbol_lower, regex=False)]
+    choices = [0.9]
     
-    # Higher relevance for market-related news
-    for keyword in market_keywords:
-        if keyword in headline_lower:
-            return 0.6
+    company_pattern = _COMPANY_PATTERNS.get(symbol_lower)
+    if company_pattern is not None:
+        conditions.append(headlines_lower.str.contains(company_pattern))
+        choices.append(0.8)
     
-    # Medium relevance for sector news
-    for keyword in tech_keywords + finance_keywords:
-        if keyword in headline_lower:
-            return 0.4
+    for score, pattern in _TIER_PATTERNS:
+        conditions.append(headlines_lower.str.contains(pattern))
+        choices.append(score)
     
-    # General financial news
-    general_keywords = ['economy', 'economic', 'business', 'corporate', 'industry']
-    for keyword in general_keywords:
-        if keyword in headline_lower:
-            return 0.3
-    
-    return 0.1  # Very low but not zero relevance for any news
+    scores = np.select([c.to_numpy(dtype=bool) for c in conditions], choices, default=0.1)
+    scores[(headlines_lower == '').to_numpy()] = 0.0
+    return scores
 
 def format_currency(value: float, currency: str = 'USD') -> str:
     """Format currency values consistently."""
@@ -152,20 +302,12 @@ def format_currency(value: float, currency: str = 'USD') -> str:
 
 def get_trading_days_back(days: int) -> List[datetime]:
     """Get list of trading days going back from today."""
-    from datetime import timedelta
-    
-    trading_days = []
-    current_date = datetime.now()
-    days_collected = 0
+    if days <= 0:
+        return []
     
-    while days_collected < days:
-        # Skip weekends (0=Monday, 6=Sunday)
-        if current_date.weekday() < 5:  # Monday to Friday
-            trading_days.append(current_date)
-            days_collected += 1
-        current_date -= timedelta(days=1)
-    
-    return list(reversed(trading_days))
+    # Business-day calendar arithmetic in one call; normalize=False keeps the
+    # current time of day on every date, like the original day-by-day walk
+    return list(pd.bdate_range(end=datetime.now(), periods=days, normalize=False).to_pydatetime())
 
 def safe_float(value: Any, default: float = 0.0) -> float:
     """Safely convert value to float."""
@@ -181,9 +323,18 @@ def safe_int(value: Any, default: int = 0) -> int:
     except (ValueError, TypeError):
         return default
 
-def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
-    """Split list into chunks of specified size."""
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+def safe_to_numeric(series: pd.Series, default: float = 0.0, dtype: Any = np.float64) -> pd.Series:
+    """Vectorized safe_float/safe_int over a Series: unparseable values become default."""
+    return pd.to_numeric(series, errors='coerce').fillna(default).astype(dtype)
+
+def chunk_list(lst: List[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Split list into chunks of specified size, lazily (one chunk alive at a time)."""
+    return (lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size))
+
+def chunk_frame(df: pd.DataFrame, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Split a DataFrame into row chunks of specified size, lazily."""
+    for i in range(0, len(df), chunk_size):
+        yield df.iloc[i:i + chunk_size]
 
 def rate_limit(delay: float = 1.0):
     """Simple rate limiting decorator."""
@@ -211,18 +362,45 @@ def detect_outliers_iqr(data: pd.Series, multiplier: float = 1.5) -> pd.Series:
         
     except Exception:
         # Return all False if calculation fails
-        return pd.Series([False] * len(data), index=data.index)
+        return pd.Series(np.zeros(len(data), dtype=bool), index=data.index)
 
 def detect_outliers_zscore(data: pd.Series, threshold: float = 3.0) -> pd.Series:
     """Detect outliers using the Z-score method."""
     try:
+        if NUMEXPR_AVAILABLE and len(data) >= NUMEXPR_MIN_ROWS:
+            # One fused, multi-threaded pass; no intermediate Series
+            outliers = numexpr.evaluate(
+                'abs((values - mean) / std) > threshold',
+                local_dict={
+                    'values': data.to_numpy(dtype=np.float64),
+                    'mean': float(data.mean()),
+                    'std': float(data.std()),
+                    'threshold': float(threshold)
+                }
+            )
+            return pd.Series(outliers, index=data.index)
+        
         z_scores = np.abs((data - data.mean()) / data.std())
         outliers = z_scores > threshold
         return outliers
         
     except Exception:
         # Return all False if calculation fails
-        return pd.Series([False] * len(data), index=data.index)
+        return pd.Series(np.zeros(len(data), dtype=bool), index=data.index)
+
+def _iqr_outlier_mask(values: np.ndarray, multiplier: float) -> np.ndarray:
+    """detect_outliers_iqr over every column of a 2-D float array at once."""
+    q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+    iqr = q3 - q1
+    return (values < q1 - multiplier * iqr) | (values > q3 + multiplier * iqr)
+
+def _zscore_outlier_mask(values: np.ndarray, threshold: float) -> np.ndarray:
+    """detect_outliers_zscore over every column of a 2-D float array at once."""
+    if NUMBA_AVAILABLE:
+        return indicators_numba.zscore_outlier_mask(values, threshold)
+    
+    z_scores = np.abs((values - np.nanmean(values, axis=0)) / np.nanstd(values, axis=0, ddof=1))
+    return z_scores > threshold
 
 def remove_outliers(df: pd.DataFrame, method: str = 'iqr', 
                    columns: List[str] = None, **kwargs) -> pd.DataFrame:
@@ -238,21 +416,24 @@ def remove_outliers(df: pd.DataFrame, method: str = 'iqr',
         if not columns:
             return df
         
-        outlier_mask = pd.Series([False] * len(df), index=df.index)
+        # One dtype scan over the selected columns (order is preserved)
+        numeric_columns = df[columns].select_dtypes(include=['float64', 'int64']).columns.tolist()
+        outlier_mask = np.zeros(len(df), dtype=bool)
         
-        for column in columns:
-            if column in df.columns and df[column].dtype in ['float64', 'int64']:
+        if numeric_columns and method in ('iqr', 'zscore') and len(df) > 0:
+            # All columns as one 2-D block: per-column statistics in a single numpy call
+            values = df[numeric_columns].to_numpy(dtype=np.float64)
+            
+            # Empty/all-NaN columns and zero spread yield NaN bounds, which flag nothing
+            with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
                 if method == 'iqr':
-                    multiplier = kwargs.get('multiplier', 1.5)
-                    col_outliers = detect_outliers_iqr(df[column], multiplier)
-                elif method == 'zscore':
-                    threshold = kwargs.get('threshold', 3.0)
-                    col_outliers = detect_outliers_zscore(df[column], threshold)
+                    col_outliers = _iqr_outlier_mask(values, kwargs.get('multiplier', 1.5))
                 else:
-                    continue
-                
-                # Combine outliers from all columns
-                outlier_mask = outlier_mask | col_outliers
+                    col_outliers = _zscore_outlier_mask(values, kwargs.get('threshold', 3.0))
+            
+            # Combine outliers from all columns
+            outlier_mask = col_outliers.any(axis=1)
         
         # Remove rows with outliers
         clean_df = df[~outlier_mask].copy()
@@ -273,7 +454,10 @@ def validate_data_completeness(df: pd.DataFrame, min_completeness: float = 0.8)
     """Validate data completeness and quality."""
     try:
         total_cells = len(df) * len(df.columns)
-        missing_cells = df.isnull().sum().sum()
+        
+        # One isnull scan feeds both the total and the per-column counts
+        missing_by_column = df.isnull().sum()
+        missing_cells = missing_by_column.sum()
         completeness = (total_cells - missing_cells) / total_cells if total_cells > 0 else 0
         
         validation_result = {
@@ -281,8 +465,8 @@ def validate_data_completeness(df: pd.DataFrame, min_completeness: float = 0.8)
             'completeness_ratio': round(completeness, 4),
             'total_rows': len(df),
             'total_columns': len(df.columns),
-            'missing_values': df.isnull().sum().to_dict(),
-            'data_types': df.dtypes.to_dict()
+            'missing_values': missing_by_column.to_dict(),
+            'data_types': {column: str(dtype) for column, dtype in df.dtypes.items()}  # JSON-ready names
         }
         
         return validation_result
@@ -319,11 +503,10 @@ def clean_financial_data(df: pd.DataFrame, config: Any = None) -> pd.DataFrame:
             clean_df = remove_outliers(df, method='zscore', threshold=threshold)
         
         # Handle missing values for critical columns
-        critical_columns = ['open', 'high', 'low', 'close', 'volume']
-        for col in critical_columns:
-            if col in clean_df.columns:
-                # Use modern pandas methods instead of deprecated fillna(method=)
-                clean_df[col] = clean_df[col].ffill().bfill()
+        critical_columns = [col for col in ['open', 'high', 'low', 'close', 'volume'] if col in clean_df.columns]
+        if critical_columns:
+            # One 2-D fill over all critical columns (column dtypes are kept)
+            clean_df[critical_columns] = clean_df[critical_columns].ffill().bfill()
         
         # Fill remaining NaN values with 0 for technical indicators
         clean_df = clean_df.fillna(0)